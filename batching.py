@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+batching.py
+
+Coalesces outbound writes, so that a node forwarding many small puts to
+the same peer sends a few large batches instead.
+
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import socket
+import threading
+from time import time
+from collections import defaultdict
+
+from thrift.Thrift import TException
+
+LIMIT = 64
+DELAY = 0.002
+
+class WriteBuffer(object):
+    def __init__(self, send, limit=LIMIT, delay=DELAY):
+        """Collects entries by destination, and hands each destination's
+        entries to `send(destination, entries)` in one go once `limit` are
+        waiting, or the oldest has waited `delay` seconds. Batches for a
+        destination are sent one at a time, in order, so entries arrive in
+        the order they were added.
+        
+        Batches that fail to send are kept for `take_failed()`. If `retry`
+        is set, the flusher calls it whenever there are some, so that they
+        are dealt with even when nothing else is being written.
+        """
+        self.send = send
+        self.retry = None
+        self.limit = limit
+        self.delay = delay
+        self.pending = dict()
+        self.since = dict()
+        self.senders = defaultdict(threading.Lock)
+        self.failed = []
+        self.lock = threading.Lock()
+        self.ready = threading.Condition(self.lock)
+        flusher = threading.Thread(target=self._run, name='flusher')
+        flusher.setDaemon(True)
+        flusher.start()
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.pending.itervalues())
+
+    def add(self, destination, entry):
+        self.lock.acquire()
+        try:
+            entries = self.pending.setdefault(destination, [])
+            if not entries:
+                self.since[destination] = time()
+                self.ready.notify()
+            entries.append(entry)
+            full = len(entries) >= self.limit
+        finally:
+            self.lock.release()
+        if full:
+            self.flush(destination)
+
+    def flush(self, destination):
+        "Send whatever is waiting for `destination` now."
+        self.lock.acquire()
+        sender = self.senders[destination]
+        self.lock.release()
+        sender.acquire()
+        try:
+            self.lock.acquire()
+            try:
+                entries = self.pending.pop(destination, None)
+                self.since.pop(destination, None)
+            finally:
+                self.lock.release()
+            if entries:
+                try:
+                    self.send(destination, entries)
+                except (TException, socket.error), tx:
+                    self.lock.acquire()
+                    self.failed.append((destination, entries, tx))
+                    self.ready.notify()
+                    self.lock.release()
+        finally:
+            sender.release()
+
+    def flush_all(self):
+        for destination in self.pending.keys():
+            self.flush(destination)
+
+    def take_failed(self):
+        """Give back the (destination, entries, error) batches that could
+        not be sent, for the caller to reroute."""
+        self.lock.acquire()
+        failed, self.failed = self.failed, []
+        self.lock.release()
+        return failed
+
+    def _run(self):
+        while True:
+            try:
+                self._flush_next()
+            except Exception, ex:
+                # the flusher must outlive any one batch
+                print 'flusher: %r' % ex
+    
+    def _flush_next(self):
+        "Wait for the oldest destination to be due and send it, or hand back failed batches."
+        self.ready.acquire()
+        try:
+            while not self.since and not (self.failed and self.retry):
+                self.ready.wait()
+            if self.failed and self.retry:
+                destination = None
+            else:
+                destination, first = min(self.since.iteritems(), key=lambda item: item[1])
+                wait = first + self.delay - time()
+                if wait > 0:
+                    self.ready.wait(wait)
+                    return
+        finally:
+            self.ready.release()
+        if destination is None:
+            self.retry()
+        else:
+            self.flush(destination)
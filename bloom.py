@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+bloom.py
+
+Bloom filters, so that a node can tell a key is missing from another
+node without asking it.
+
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import md5
+import math
+import zlib
+import struct
+
+HEADER = struct.Struct('>II')
+
+class BloomFilter(object):
+    def __init__(self, bits, hashes, data=None):
+        """A set of keys that can say for certain a key was never added,
+        but only probably that it was. `bits` is rounded up to whole bytes.
+        """
+        self.bits = (bits + 7) & ~7
+        self.hashes = hashes
+        if data is None:
+            data = bytearray(self.bits // 8)
+        self.data = data
+        self.count = 0
+
+    def _positions(self, key):
+        digest = md5.new(key).hexdigest()
+        first, step = int(digest[:16], 16), int(digest[16:], 16) | 1
+        return [(first + i * step) % self.bits for i in xrange(self.hashes)]
+
+    def add(self, key):
+        "Add `key`, and return whether that changed the filter."
+        changed = False
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not self.data[position >> 3] & mask:
+                self.data[position >> 3] |= mask
+                changed = True
+        if changed:
+            self.count += 1
+        return changed
+
+    def __contains__(self, key):
+        for position in self._positions(key):
+            if not self.data[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def dumps(self):
+        "A compact form of the filter for sending to other nodes."
+        return HEADER.pack(self.bits, self.hashes) + zlib.compress(str(self.data))
+
+    def __repr__(self):
+        return '<BloomFilter %d bits, %d hashes, %d keys>' % (self.bits, self.hashes, self.count)
+
+
+def for_capacity(capacity, error=0.01):
+    "A filter sized to hold `capacity` keys with the given false-positive rate."
+    capacity = max(capacity, 1)
+    bits = int(math.ceil(-capacity * math.log(error) / math.log(2) ** 2))
+    hashes = max(1, int(round(bits / float(capacity) * math.log(2))))
+    return BloomFilter(bits, hashes)
+
+def loads(blob):
+    bits, hashes = HEADER.unpack_from(blob)
+    return BloomFilter(bits, hashes, bytearray(zlib.decompress(blob[HEADER.size:])))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+codecbench.py
+
+Compares the transports and protocols nodes can talk over: the bytes each
+puts on the wire, and what encoding and decoding cost, for puts of a few
+value sizes and a page of scan results, each as a whole message.
+Needs no running node.
+
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import sys
+sys.path.append('gen-py')
+from time import time
+from optparse import OptionParser
+
+from thrift.Thrift import TMessageType
+from thrift.transport import TTransport
+
+from diststore import Store
+from diststore.ttypes import KeyValue, ScanPage
+from location import TRANSPORTS, PROTOCOLS, READERS, fastbinary
+
+usage = '''
+  python %prog [options]
+
+Encodes and decodes each message NUMBER times in every combination
+of transport and protocol, and prints a table of message sizes and
+the average microseconds taken.'''
+
+parser = OptionParser(usage=usage)
+parser.add_option("-n", "--number", type="int",
+                  help="Time NUMBER rounds of each [default=2000]",
+                  default=2000)
+
+def messages():
+    for size in (10, 1000, 100000):
+        yield 'put %d bytes' % size, Store.put_args(key='key', value='x' * size)
+    items = [KeyValue(key='key%04d' % i, value='v' * 100) for i in xrange(100)]
+    yield 'scan page of 100', Store.scan_result(success=ScanPage(items=items, cursor=items[-1].key))
+
+def codecs():
+    yield 'binary', PROTOCOLS['binary'], PROTOCOLS['binary']
+    if fastbinary:
+        yield 'binary+fastbinary', READERS['binary'], READERS['binary']
+    if 'compact' in PROTOCOLS:
+        yield 'compact', PROTOCOLS['compact'], PROTOCOLS['compact']
+
+def encode(message, transport, protocol):
+    buf = TTransport.TMemoryBuffer()
+    trans = TRANSPORTS[transport].getTransport(buf)
+    oprot = protocol.getProtocol(trans)
+    oprot.writeMessageBegin('bench', TMessageType.CALL, 0)
+    message.write(oprot)
+    oprot.writeMessageEnd()
+    trans.flush()
+    return buf.getvalue()
+
+def decode(data, cls, transport, protocol):
+    trans = TRANSPORTS[transport].getTransport(TTransport.TMemoryBuffer(data))
+    iprot = protocol.getProtocol(trans)
+    iprot.readMessageBegin()
+    message = cls()
+    message.read(iprot)
+    iprot.readMessageEnd()
+    return message
+
+def timed(number, func, *args):
+    "Average microseconds for a call of `func`."
+    start = time()
+    for i in xrange(number):
+        func(*args)
+    return (time() - start) * 1e6 / number
+
+if __name__ == '__main__':
+    (options, args) = parser.parse_args()
+    if not fastbinary:
+        print 'fastbinary is not available; binary is pure python throughout'
+    print '%-18s %-18s %-9s %8s %10s %10s' % (
+        'message', 'protocol', 'transport', 'bytes', 'encode us', 'decode us')
+    for name, message in messages():
+        for codec, reader, writer in codecs():
+            for transport in sorted(TRANSPORTS):
+                data = encode(message, transport, writer)
+                assert decode(data, message.__class__, transport, reader) == message
+                print '%-18s %-18s %-9s %8d %10.1f %10.1f' % (name, codec, transport, len(data),
+                    timed(options.number, encode, message, transport, writer),
+                    timed(options.number, decode, data, message.__class__, transport, reader))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+compression.py
+
+Tagged value compression for diststore. An encoded value is a single
+codec byte followed by the payload, so any node can decode what any other
+node encoded, whatever codec it was configured with.
+
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import zlib
+try:
+    import snappy
+except ImportError:
+    snappy = None
+
+RAW = '\x00'
+ZLIB = '\x01'
+SNAPPY = '\x02'
+
+THRESHOLD = 512
+
+CODECS = ['zlib']
+if snappy:
+    CODECS.append('snappy')
+
+def encode_raw(value):
+    return RAW + str(value)
+
+def decode(blob):
+    """Give back the original value of an encoded blob. An uncompressed
+    value comes back as a buffer onto the blob rather than a copy."""
+    if not blob:
+        return ''
+    tag = blob[0]
+    if tag == RAW:
+        return buffer(blob, 1)
+    elif tag == ZLIB:
+        return zlib.decompress(buffer(blob, 1))
+    elif tag == SNAPPY:
+        if not snappy:
+            raise ValueError('snappy-compressed value, but snappy is not installed')
+        return snappy.decompress(str(buffer(blob, 1)))
+    raise ValueError('unknown codec tag %r' % tag)
+
+class Compressor(object):
+    def __init__(self, codec='zlib', level=6, threshold=THRESHOLD):
+        """Values shorter than `threshold` bytes, or that don't shrink, are
+        left as they are. `level` only applies to zlib."""
+        if codec not in CODECS:
+            raise ValueError('codec %r is not available' % codec)
+        self.codec = codec
+        self.level = level
+        self.threshold = threshold
+
+    def encode(self, value):
+        return self.compress(value) or encode_raw(value)
+
+    def compress(self, value):
+        "The compressed blob for `value`, or None if it isn't worth it."
+        if len(value) < self.threshold:
+            return None
+        if self.codec == 'snappy':
+            packed = SNAPPY + snappy.compress(str(value))
+        else:
+            packed = ZLIB + zlib.compress(value, self.level)
+        if len(packed) > len(value):
+            return None
+        return packed
+
+    def __repr__(self):
+        return '<Compressor %s level %d over %d bytes>' % (
+            self.codec, self.level, self.threshold)
+
@@ -28,7 +28,52 @@ THE SOFTWARE.
 
 include "locator.thrift"
 
+struct Count {
+ 1: string name,
+ 2: i64 count,
+}
+
+struct Entry {
+ 1: binary key,
+ 2: binary blob,
+ 3: i32 ttl,
+}
+
+struct KeyValue {
+ 1: binary key,
+ 2: binary value,
+}
+
+struct ScanPage {
+ 1: list<KeyValue> items,
+ 2: binary cursor,
+}
+
+struct LoadReport {
+ 1: i64 requests,
+ 2: list<Count> keys,
+ 3: list<Count> arcs,
+}
+
 service Store extends locator.Locator {
- string         get (1:string key)
- oneway void    put (1:string key, 2:string value)
+ binary         get (1:binary key)
+ oneway void    put (1:binary key, 2:binary value)
+ oneway void    put_ttl (1:binary key, 2:binary value, 3:i32 ttl)
+ binary         get_encoded (1:binary key, 2:locator.Location reader, 3:i32 budget)
+ oneway void    put_encoded (1:binary key, 2:binary blob, 3:i32 ttl, 4:i32 budget)
+ oneway void    invalidate (1:list<binary> keys)
+ oneway void    put_batch (1:list<Entry> entries)
+ map<string,i64> stats ()
+ LoadReport     load_report (1:i32 limit)
+ bool           snapshot ()
+ binary         bloom_filter (1:locator.Location subscriber)
+ oneway void    filter_update (1:locator.Location owner, 2:list<binary> keys)
+ ScanPage       scan (1:binary prefix, 2:binary cursor, 3:i32 limit)
+ oneway void    put_chunk (1:binary key, 2:i64 offset, 3:binary data)
+ bool           put_commit (1:binary key, 2:i64 length, 3:string digest, 4:i32 ttl)
+ binary         get_chunk (1:binary key, 2:i64 offset, 3:i32 length)
+ list<string>   merkle_hashes (1:i64 arc, 2:list<i32> nodes)
+ map<binary,string> merkle_items (1:i64 arc, 2:list<i32> nodes)
+ oneway void    replicate (1:binary key, 2:binary blob, 3:i32 ttl)
+ binary         get_replica (1:binary key)
 }
@@ -24,19 +24,30 @@ class Iface(locator.Base.Iface):
     """
     pass
 
-  def remove(self, location, authorities):
+  def remove(self, location, authorities, budget):
     """
     Parameters:
      - location
      - authorities
+     - budget
     """
     pass
 
-  def add(self, location, authorities):
+  def add(self, location, authorities, budget):
     """
     Parameters:
      - location
      - authorities
+     - budget
+    """
+    pass
+
+  def reweigh(self, location, authorities, budget):
+    """
+    Parameters:
+     - location
+     - authorities
+     - budget
     """
     pass
 
@@ -50,6 +61,16 @@ class Iface(locator.Base.Iface):
     """
     pass
 
+  def vnodes(self, ):
+    pass
+
+  def ring_stats(self, vnodes):
+    """
+    Parameters:
+     - vnodes
+    """
+    pass
+
 
 class Client(locator.Base.Client, Iface):
   def __init__(self, iprot, oprot=None):
@@ -69,35 +90,57 @@ class Client(locator.Base.Client, Iface):
     args.write(self._oprot)
     self._oprot.writeMessageEnd()
     self._oprot.trans.flush()
-  def remove(self, location, authorities):
+  def remove(self, location, authorities, budget):
     """
     Parameters:
      - location
      - authorities
+     - budget
     """
-    self.send_remove(location, authorities)
+    self.send_remove(location, authorities, budget)
 
-  def send_remove(self, location, authorities):
+  def send_remove(self, location, authorities, budget):
     self._oprot.writeMessageBegin('remove', TMessageType.CALL, self._seqid)
     args = remove_args()
     args.location = location
     args.authorities = authorities
+    args.budget = budget
     args.write(self._oprot)
     self._oprot.writeMessageEnd()
     self._oprot.trans.flush()
-  def add(self, location, authorities):
+  def add(self, location, authorities, budget):
     """
     Parameters:
      - location
      - authorities
+     - budget
     """
-    self.send_add(location, authorities)
+    self.send_add(location, authorities, budget)
 
-  def send_add(self, location, authorities):
+  def send_add(self, location, authorities, budget):
     self._oprot.writeMessageBegin('add', TMessageType.CALL, self._seqid)
     args = add_args()
     args.location = location
     args.authorities = authorities
+    args.budget = budget
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+  def reweigh(self, location, authorities, budget):
+    """
+    Parameters:
+     - location
+     - authorities
+     - budget
+    """
+    self.send_reweigh(location, authorities, budget)
+
+  def send_reweigh(self, location, authorities, budget):
+    self._oprot.writeMessageBegin('reweigh', TMessageType.CALL, self._seqid)
+    args = reweigh_args()
+    args.location = location
+    args.authorities = authorities
+    args.budget = budget
     args.write(self._oprot)
     self._oprot.writeMessageEnd()
     self._oprot.trans.flush()
@@ -156,6 +199,61 @@ class Client(locator.Base.Client, Iface):
       return result.success
     raise TApplicationException(TApplicationException.MISSING_RESULT, "get_node failed: unknown result");
 
+  def vnodes(self, ):
+    self.send_vnodes()
+    return self.recv_vnodes()
+
+  def send_vnodes(self, ):
+    self._oprot.writeMessageBegin('vnodes', TMessageType.CALL, self._seqid)
+    args = vnodes_args()
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_vnodes(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = vnodes_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "vnodes failed: unknown result");
+
+  def ring_stats(self, vnodes):
+    """
+    Parameters:
+     - vnodes
+    """
+    self.send_ring_stats(vnodes)
+    return self.recv_ring_stats()
+
+  def send_ring_stats(self, vnodes):
+    self._oprot.writeMessageBegin('ring_stats', TMessageType.CALL, self._seqid)
+    args = ring_stats_args()
+    args.vnodes = vnodes
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_ring_stats(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = ring_stats_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "ring_stats failed: unknown result");
+
 
 class Processor(locator.Base.Processor, Iface, TProcessor):
   def __init__(self, handler):
@@ -163,8 +261,11 @@ class Processor(locator.Base.Processor, Iface, TProcessor):
     self._processMap["join"] = Processor.process_join
     self._processMap["remove"] = Processor.process_remove
     self._processMap["add"] = Processor.process_add
+    self._processMap["reweigh"] = Processor.process_reweigh
     self._processMap["get_all"] = Processor.process_get_all
     self._processMap["get_node"] = Processor.process_get_node
+    self._processMap["vnodes"] = Processor.process_vnodes
+    self._processMap["ring_stats"] = Processor.process_ring_stats
 
   def process(self, iprot, oprot):
     (name, type, seqid) = iprot.readMessageBegin()
@@ -192,14 +293,21 @@ class Processor(locator.Base.Processor, Iface, TProcessor):
     args = remove_args()
     args.read(iprot)
     iprot.readMessageEnd()
-    self._handler.remove(args.location, args.authorities)
+    self._handler.remove(args.location, args.authorities, args.budget)
     return
 
   def process_add(self, seqid, iprot, oprot):
     args = add_args()
     args.read(iprot)
     iprot.readMessageEnd()
-    self._handler.add(args.location, args.authorities)
+    self._handler.add(args.location, args.authorities, args.budget)
+    return
+
+  def process_reweigh(self, seqid, iprot, oprot):
+    args = reweigh_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    self._handler.reweigh(args.location, args.authorities, args.budget)
     return
 
   def process_get_all(self, seqid, iprot, oprot):
@@ -224,6 +332,28 @@ class Processor(locator.Base.Processor, Iface, TProcessor):
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
+  def process_vnodes(self, seqid, iprot, oprot):
+    args = vnodes_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = vnodes_result()
+    result.success = self._handler.vnodes()
+    oprot.writeMessageBegin("vnodes", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_ring_stats(self, seqid, iprot, oprot):
+    args = ring_stats_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = ring_stats_result()
+    result.success = self._handler.ring_stats(args.vnodes)
+    oprot.writeMessageBegin("ring_stats", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
 
 # HELPER FUNCTIONS AND STRUCTURES
 
@@ -289,17 +419,20 @@ class remove_args(object):
   Attributes:
    - location
    - authorities
+   - budget
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'location', (Location, Location.thrift_spec), None, ), # 1
     (2, TType.LIST, 'authorities', (TType.STRUCT,(Location, Location.thrift_spec)), None, ), # 2
+    (3, TType.I32, 'budget', None, None, ), # 3
   )
 
-  def __init__(self, location=None, authorities=None,):
+  def __init__(self, location=None, authorities=None, budget=None,):
     self.location = location
     self.authorities = authorities
+    self.budget = budget
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -319,14 +452,19 @@ class remove_args(object):
       elif fid == 2:
         if ftype == TType.LIST:
           self.authorities = []
-          (_etype10, _size7) = iprot.readListBegin()
-          for _i11 in xrange(_size7):
-            _elem12 = Location()
-            _elem12.read(iprot)
-            self.authorities.append(_elem12)
+          (_etype28, _size25) = iprot.readListBegin()
+          for _i29 in xrange(_size25):
+            _elem30 = Location()
+            _elem30.read(iprot)
+            self.authorities.append(_elem30)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32:
+          self.budget = iprot.readI32();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -344,10 +482,14 @@ class remove_args(object):
     if self.authorities != None:
       oprot.writeFieldBegin('authorities', TType.LIST, 2)
       oprot.writeListBegin(TType.STRUCT, len(self.authorities))
-      for iter13 in self.authorities:
-        iter13.write(oprot)
+      for iter31 in self.authorities:
+        iter31.write(oprot)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
+    if self.budget != None:
+      oprot.writeFieldBegin('budget', TType.I32, 3)
+      oprot.writeI32(self.budget)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -367,17 +509,20 @@ class add_args(object):
   Attributes:
    - location
    - authorities
+   - budget
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'location', (Location, Location.thrift_spec), None, ), # 1
     (2, TType.LIST, 'authorities', (TType.STRUCT,(Location, Location.thrift_spec)), None, ), # 2
+    (3, TType.I32, 'budget', None, None, ), # 3
   )
 
-  def __init__(self, location=None, authorities=None,):
+  def __init__(self, location=None, authorities=None, budget=None,):
     self.location = location
     self.authorities = authorities
+    self.budget = budget
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -397,14 +542,19 @@ class add_args(object):
       elif fid == 2:
         if ftype == TType.LIST:
           self.authorities = []
-          (_etype17, _size14) = iprot.readListBegin()
-          for _i18 in xrange(_size14):
-            _elem19 = Location()
-            _elem19.read(iprot)
-            self.authorities.append(_elem19)
+          (_etype35, _size32) = iprot.readListBegin()
+          for _i36 in xrange(_size32):
+            _elem37 = Location()
+            _elem37.read(iprot)
+            self.authorities.append(_elem37)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32:
+          self.budget = iprot.readI32();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -422,10 +572,104 @@ class add_args(object):
     if self.authorities != None:
       oprot.writeFieldBegin('authorities', TType.LIST, 2)
       oprot.writeListBegin(TType.STRUCT, len(self.authorities))
-      for iter20 in self.authorities:
-        iter20.write(oprot)
+      for iter38 in self.authorities:
+        iter38.write(oprot)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
+    if self.budget != None:
+      oprot.writeFieldBegin('budget', TType.I32, 3)
+      oprot.writeI32(self.budget)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class reweigh_args(object):
+  """
+  Attributes:
+   - location
+   - authorities
+   - budget
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'location', (Location, Location.thrift_spec), None, ), # 1
+    (2, TType.LIST, 'authorities', (TType.STRUCT,(Location, Location.thrift_spec)), None, ), # 2
+    (3, TType.I32, 'budget', None, None, ), # 3
+  )
+
+  def __init__(self, location=None, authorities=None, budget=None,):
+    self.location = location
+    self.authorities = authorities
+    self.budget = budget
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.location = Location()
+          self.location.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.LIST:
+          self.authorities = []
+          (_etype42, _size39) = iprot.readListBegin()
+          for _i43 in xrange(_size39):
+            _elem44 = Location()
+            _elem44.read(iprot)
+            self.authorities.append(_elem44)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32:
+          self.budget = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('reweigh_args')
+    if self.location != None:
+      oprot.writeFieldBegin('location', TType.STRUCT, 1)
+      self.location.write(oprot)
+      oprot.writeFieldEnd()
+    if self.authorities != None:
+      oprot.writeFieldBegin('authorities', TType.LIST, 2)
+      oprot.writeListBegin(TType.STRUCT, len(self.authorities))
+      for iter45 in self.authorities:
+        iter45.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.budget != None:
+      oprot.writeFieldBegin('budget', TType.I32, 3)
+      oprot.writeI32(self.budget)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -503,11 +747,11 @@ class get_all_result(object):
       if fid == 0:
         if ftype == TType.LIST:
           self.success = []
-          (_etype24, _size21) = iprot.readListBegin()
-          for _i25 in xrange(_size21):
-            _elem26 = Location()
-            _elem26.read(iprot)
-            self.success.append(_elem26)
+          (_etype49, _size46) = iprot.readListBegin()
+          for _i50 in xrange(_size46):
+            _elem51 = Location()
+            _elem51.read(iprot)
+            self.success.append(_elem51)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
@@ -524,8 +768,8 @@ class get_all_result(object):
     if self.success != None:
       oprot.writeFieldBegin('success', TType.LIST, 0)
       oprot.writeListBegin(TType.STRUCT, len(self.success))
-      for iter27 in self.success:
-        iter27.write(oprot)
+      for iter52 in self.success:
+        iter52.write(oprot)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
@@ -654,4 +898,209 @@ class get_node_result(object):
   def __ne__(self, other):
     return not (self == other)
 
+class vnodes_args(object):
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('vnodes_args')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class vnodes_result(object):
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.I32, 'success', None, None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.I32:
+          self.success = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('vnodes_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.I32, 0)
+      oprot.writeI32(self.success)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ring_stats_args(object):
+  """
+  Attributes:
+   - vnodes
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'vnodes', None, None, ), # 1
+  )
+
+  def __init__(self, vnodes=None,):
+    self.vnodes = vnodes
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32:
+          self.vnodes = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ring_stats_args')
+    if self.vnodes != None:
+      oprot.writeFieldBegin('vnodes', TType.I32, 1)
+      oprot.writeI32(self.vnodes)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ring_stats_result(object):
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.STRUCT, 'success', (RingStats, RingStats.thrift_spec), None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.STRUCT:
+          self.success = RingStats()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ring_stats_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
 
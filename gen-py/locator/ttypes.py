@@ -19,17 +19,26 @@ class Location(object):
   Attributes:
    - address
    - port
+   - zone
+   - rack
+   - weight
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRING, 'address', None, None, ), # 1
     (2, TType.I16, 'port', None, None, ), # 2
+    (3, TType.STRING, 'zone', None, None, ), # 3
+    (4, TType.STRING, 'rack', None, None, ), # 4
+    (5, TType.I32, 'weight', None, None, ), # 5
   )
 
-  def __init__(self, address=None, port=None,):
+  def __init__(self, address=None, port=None, zone=None, rack=None, weight=None,):
     self.address = address
     self.port = port
+    self.zone = zone
+    self.rack = rack
+    self.weight = weight
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -50,6 +59,21 @@ class Location(object):
           self.port = iprot.readI16();
         else:
           iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.zone = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.STRING:
+          self.rack = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.I32:
+          self.weight = iprot.readI32();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -68,6 +92,166 @@ class Location(object):
       oprot.writeFieldBegin('port', TType.I16, 2)
       oprot.writeI16(self.port)
       oprot.writeFieldEnd()
+    if self.zone != None:
+      oprot.writeFieldBegin('zone', TType.STRING, 3)
+      oprot.writeString(self.zone)
+      oprot.writeFieldEnd()
+    if self.rack != None:
+      oprot.writeFieldBegin('rack', TType.STRING, 4)
+      oprot.writeString(self.rack)
+      oprot.writeFieldEnd()
+    if self.weight != None:
+      oprot.writeFieldBegin('weight', TType.I32, 5)
+      oprot.writeI32(self.weight)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class RingStats(object):
+  """
+  Attributes:
+   - vnodes
+   - points
+   - ownership
+   - stddev
+   - max_mean
+   - join_moves
+   - leave_moves
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'vnodes', None, None, ), # 1
+    (2, TType.I32, 'points', None, None, ), # 2
+    (3, TType.MAP, 'ownership', (TType.STRING,None,TType.DOUBLE,None), None, ), # 3
+    (4, TType.DOUBLE, 'stddev', None, None, ), # 4
+    (5, TType.DOUBLE, 'max_mean', None, None, ), # 5
+    (6, TType.DOUBLE, 'join_moves', None, None, ), # 6
+    (7, TType.MAP, 'leave_moves', (TType.STRING,None,TType.DOUBLE,None), None, ), # 7
+  )
+
+  def __init__(self, vnodes=None, points=None, ownership=None, stddev=None, max_mean=None, join_moves=None, leave_moves=None,):
+    self.vnodes = vnodes
+    self.points = points
+    self.ownership = ownership
+    self.stddev = stddev
+    self.max_mean = max_mean
+    self.join_moves = join_moves
+    self.leave_moves = leave_moves
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32:
+          self.vnodes = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32:
+          self.points = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.MAP:
+          self.ownership = {}
+          (_ktype1, _vtype2, _size0 ) = iprot.readMapBegin() 
+          for _i4 in xrange(_size0):
+            _key5 = iprot.readString();
+            _val6 = iprot.readDouble();
+            self.ownership[_key5] = _val6
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.DOUBLE:
+          self.stddev = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.DOUBLE:
+          self.max_mean = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.DOUBLE:
+          self.join_moves = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.MAP:
+          self.leave_moves = {}
+          (_ktype8, _vtype9, _size7 ) = iprot.readMapBegin() 
+          for _i11 in xrange(_size7):
+            _key12 = iprot.readString();
+            _val13 = iprot.readDouble();
+            self.leave_moves[_key12] = _val13
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('RingStats')
+    if self.vnodes != None:
+      oprot.writeFieldBegin('vnodes', TType.I32, 1)
+      oprot.writeI32(self.vnodes)
+      oprot.writeFieldEnd()
+    if self.points != None:
+      oprot.writeFieldBegin('points', TType.I32, 2)
+      oprot.writeI32(self.points)
+      oprot.writeFieldEnd()
+    if self.ownership != None:
+      oprot.writeFieldBegin('ownership', TType.MAP, 3)
+      oprot.writeMapBegin(TType.STRING, TType.DOUBLE, len(self.ownership))
+      for kiter14,viter15 in self.ownership.items():
+        oprot.writeString(kiter14)
+        oprot.writeDouble(viter15)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    if self.stddev != None:
+      oprot.writeFieldBegin('stddev', TType.DOUBLE, 4)
+      oprot.writeDouble(self.stddev)
+      oprot.writeFieldEnd()
+    if self.max_mean != None:
+      oprot.writeFieldBegin('max_mean', TType.DOUBLE, 5)
+      oprot.writeDouble(self.max_mean)
+      oprot.writeFieldEnd()
+    if self.join_moves != None:
+      oprot.writeFieldBegin('join_moves', TType.DOUBLE, 6)
+      oprot.writeDouble(self.join_moves)
+      oprot.writeFieldEnd()
+    if self.leave_moves != None:
+      oprot.writeFieldBegin('leave_moves', TType.MAP, 7)
+      oprot.writeMapBegin(TType.STRING, TType.DOUBLE, len(self.leave_moves))
+      for kiter16,viter17 in self.leave_moves.items():
+        oprot.writeString(kiter16)
+        oprot.writeDouble(viter17)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
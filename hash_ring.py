@@ -47,20 +47,29 @@
 #   ring.gen_key('a') == ring.gen_key(md5.new('a').hexdigest())
 # ...does not hash again
 # This last one may make things unsuitable for other people.
+#
+# append/extend/reweigh regenerate the circle from scratch, as weighted
+# nodes' shares change with every node that comes or goes
 
 import md5
 import math
 from bisect import bisect
 
 HEXDIGITS = 'abcdef0123456789'
+VNODES = 30
+KEYSPACE = 1 << 32
+JOINERS = 4
 
 class HashRing(object):
 
-    def __init__(self, nodes=[], weights=None):
+    def __init__(self, nodes=[], weights=None, vnodes=VNODES):
         """`nodes` is a list of objects that have a proper __str__ representation.
         `weights` is dictionary that sets weights to the nodes.  The default
         weight is that all nodes are equal.
+        `vnodes` is how many times a node of average weight is hashed onto
+        the ring, each hash giving four points.
         """
+        self.vnodes = vnodes
         self.ring = dict()
         self._sorted_keys = []
 
@@ -69,23 +78,24 @@ class HashRing(object):
         if not weights:
             weights = {}
         self.weights = weights
+        self.epoch = 0
 
         self._generate_circle()
 
     def _generate_circle(self):
-        """Generates the circle.
+        """Generates the circle, afresh: a node's share of points depends
+        on everyone's weights. Nodes without a weight count as the average.
         """
-        total_weight = 0
-        for node in self.nodes:
-            total_weight += self.weights.get(node, 1)
+        self.ring = dict()
+        self._sorted_keys = []
 
-        for node in self.nodes:
-            weight = 1
+        weights = self._weights()
+        total_weight = sum(weights.values())
 
-            if node in self.weights:
-                weight = self.weights.get(node)
+        for node in self.nodes:
+            weight = weights[node]
 
-            factor = math.floor((30*len(self.nodes)*weight) / total_weight);
+            factor = math.floor((self.vnodes*len(self.nodes)*weight) / total_weight);
 
             for j in xrange(0, int(factor)):
                 b_key = self._hash_digest( '%s-%s' % (node, j) )
@@ -96,7 +106,17 @@ class HashRing(object):
                     self._sorted_keys.append(key)
 
         self._sorted_keys.sort()
+        self.epoch += 1
     
+    def _weights(self):
+        """Every node's weight; nodes without one count as the average."""
+        given = [self.weights[node] for node in self.nodes if node in self.weights]
+        if given:
+            usual = float(sum(given)) / len(given)
+        else:
+            usual = 1
+        return dict((node, self.weights.get(node, usual)) for node in self.nodes)
+
     def append(self, item):
         self.nodes.add(item)
         self._generate_circle()
@@ -107,8 +127,11 @@ class HashRing(object):
 
     def remove(self, item):
         self.nodes.discard(item)
-        self._sorted_keys = []
-        self.ring = dict()
+        self.weights.pop(item, None)
+        self._generate_circle()
+
+    def reweigh(self, item, weight):
+        self.weights[item] = weight
         self._generate_circle()
     
     def __getitem__(self, item):
@@ -145,6 +168,23 @@ class HashRing(object):
         else:
             return pos
 
+    def get_point(self, string_key):
+        """Given a string key, the point on the ring that ends the arc
+        it falls on. Points are stable as long as the nodes are.
+
+        If the hash ring is empty, `None` is returned.
+        """
+        pos = self.get_node_pos(string_key)
+        if pos is None:
+            return None
+        return self._sorted_keys[pos]
+
+    def points(self, node):
+        """Returns the points on the ring that end the arcs `node` is
+        responsible for.
+        """
+        return sorted(key for key, value in self.ring.iteritems() if value == node)
+
     def iterate_nodes(self, string_key, distinct=True):
         """Given a string key it returns the nodes as a generator that can hold the key.
 
@@ -175,6 +215,118 @@ class HashRing(object):
                 if val:
                     yield val
 
+    def spread_nodes(self, string_key, count, *groupings):
+        """Returns the first `count` distinct nodes that can hold the key,
+        spread out over groups of nodes.
+
+        Each function in `groupings` gives the group a node is in (its zone,
+        say, then its rack). Going round the ring from the key, nodes in a
+        group not yet chosen are taken first, by the first grouping, then
+        the next; the rest are taken in ring order. The first node is
+        always the one `get_node` returns.
+        """
+        if not self.ring:
+            return []
+        candidates = list(self.iterate_nodes(string_key))
+        chosen = candidates[:1]
+        for group in groupings + (None,):
+            for node in candidates:
+                if len(chosen) >= count:
+                    return chosen
+                if node in chosen:
+                    continue
+                if group is None or group(node) not in [group(n) for n in chosen]:
+                    chosen.append(node)
+        return chosen
+
+    def arcs(self):
+        """Yields (start, end, node) for each arc of the key space, in
+        order: the keys from `start` up to, but not including, `end` go to
+        `node`.
+        """
+        if not self.ring:
+            return
+        start = 0
+        for point in self._sorted_keys:
+            end = min(point, KEYSPACE)
+            if end > start:
+                yield start, end, self.ring[point]
+                start = end
+            if start == KEYSPACE:
+                return
+        yield start, KEYSPACE, self.ring[self._sorted_keys[0]]
+
+    def ownership(self):
+        """The fraction of the key space each node gets."""
+        shares = dict((node, 0.0) for node in self.nodes)
+        for start, end, node in self.arcs():
+            shares[node] += float(end - start) / KEYSPACE
+        return shares
+
+    def moved(self, other):
+        """The fraction of the key space that goes to a different node in
+        the HashRing `other`.
+        """
+        mine, theirs = list(self.arcs()), list(other.arcs())
+        if not mine or not theirs:
+            return float(bool(mine or theirs))
+        i = j = 0
+        start = moved = 0
+        while i < len(mine) and j < len(theirs):
+            end = min(mine[i][1], theirs[j][1])
+            if mine[i][2] != theirs[j][2]:
+                moved += end - start
+            start = end
+            if mine[i][1] == end:
+                i += 1
+            if theirs[j][1] == end:
+                j += 1
+        return float(moved) / KEYSPACE
+
+    def balance(self, vnodes=None, joiners=JOINERS):
+        """How well the ring shares out the key space, as it is or with
+        `vnodes` instead. Returns a dict of:
+
+            ownership:   each node's fraction of the key space
+            stddev:      the standard deviation of each node's fraction
+                         over its fair share, given the weights
+            max_mean:    the largest of those over their mean
+            join_moves:  the fraction of the key space expected to move
+                         should a node of average weight join, averaged
+                         over `joiners` made-up nodes
+            leave_moves: the fraction that would move should each node
+                         leave: the arcs it holds, which go on to the nodes
+                         after them. With weights, the others' points are
+                         redrawn too, and shift a little more than this.
+            points:      how many points the ring has
+
+        Each joiner takes a ring drawn afresh, so this takes a while for a
+        large ring; work it out on a copy.
+        """
+        if vnodes is None or vnodes == self.vnodes:
+            ring = self
+        else:
+            ring = HashRing(self.nodes, dict(self.weights), vnodes)
+        shares = ring.ownership()
+        weights = ring._weights()
+        total_weight = sum(weights.values())
+        ratios = [shares[node] * total_weight / weights[node] for node in shares]
+        if ratios:
+            mean = sum(ratios) / len(ratios)
+            stddev = math.sqrt(sum((r - mean) ** 2 for r in ratios) / len(ratios))
+            max_mean = mean and max(ratios) / mean
+        else:
+            stddev = max_mean = 0.0
+        join_moves = 0.0
+        for n in xrange(joiners):
+            joined = HashRing(list(self.nodes) + ['joining-%d:0' % n], dict(self.weights),
+                              ring.vnodes)
+            join_moves += ring.moved(joined) / joiners
+        leave_moves = dict(shares)
+        return dict(ownership=shares, stddev=stddev, max_mean=max_mean,
+                    join_moves=join_moves, leave_moves=leave_moves,
+                    points=len(ring._sorted_keys))
+
     def gen_key(self, key):
         """Given a string key it returns a long value,
         this long value represents a place on the hash ring.
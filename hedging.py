@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+hedging.py
+
+When to hedge a read: after the owner has taken longer than it usually
+does to answer, and only as often as a budget of extra requests allows.
+
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import threading
+from collections import deque
+
+PERCENTILE = 95
+SAMPLES = 1000
+REFRESH = 100
+MINSAMPLES = 20
+FLOOR = 0.001
+BUDGET = 5
+BURST = 10
+
+class Hedger(object):
+    def __init__(self, budget=BUDGET, percentile=PERCENTILE, samples=SAMPLES):
+        """Keeps the last `samples` latencies of the owners' answers, and
+        hedges once a read has waited longer than the `percentile` of them.
+        Every read earns `budget` percent of a hedge, up to BURST saved up,
+        so hedges add at most `budget` percent to the reads sent out.
+        Reads are timed and hedged without holding the node, so all of this
+        is kept under a lock of its own.
+        """
+        self.lock = threading.Lock()
+        self.budget = budget / 100.0
+        self.percentile = percentile
+        self.latencies = deque(maxlen=samples)
+        self.fresh = 0
+        self.threshold = None
+        self.tokens = 0.0
+        self.reads = 0
+        self.hedges = 0
+        self.wins = 0
+
+    def record(self, seconds):
+        """Note how long the owner took to answer a read, or how long it had
+        been given when the read was answered without it."""
+        self.lock.acquire()
+        try:
+            self.latencies.append(seconds)
+            self.fresh += 1
+            if self.fresh >= REFRESH or self.threshold is None:
+                self._refresh()
+        finally:
+            self.lock.release()
+
+    def _refresh(self):
+        self.fresh = 0
+        if len(self.latencies) < MINSAMPLES:
+            return
+        ordered = sorted(self.latencies)
+        rank = min(len(ordered) - 1, len(ordered) * self.percentile // 100)
+        self.threshold = max(FLOOR, ordered[rank])
+
+    def delay(self):
+        """Seconds to give the owner before hedging a read that is starting
+        now, or None not to hedge it at all. Reads are not hedged until
+        there are enough answers to know what slow is."""
+        self.lock.acquire()
+        try:
+            self.reads += 1
+            self.tokens = min(BURST, self.tokens + self.budget)
+            if self.threshold is None or self.tokens < 1:
+                return None
+            return self.threshold
+        finally:
+            self.lock.release()
+
+    def hedged(self):
+        "Pay for a hedge that is being sent."
+        self.lock.acquire()
+        self.tokens -= 1
+        self.hedges += 1
+        self.lock.release()
+
+    def won(self):
+        "Note a hedge that answered before the owner did."
+        self.lock.acquire()
+        self.wins += 1
+        self.lock.release()
+
+    def stats(self):
+        self.lock.acquire()
+        try:
+            return dict(hedge_reads=self.reads, hedges=self.hedges, hedge_wins=self.wins,
+                        hedge_delay_us=int((self.threshold or 0) * 1000000))
+        finally:
+            self.lock.release()
+
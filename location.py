@@ -28,14 +28,20 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+import os
 import sys
 sys.path.append('gen-py')
 import socket 
+import inspect
+import traceback
+import thread
+import threading
 from collections import defaultdict
 from math import sqrt
-from time import sleep
-from optparse import OptionParser, make_option
+from time import sleep, time
+from optparse import OptionParser, OptionValueError, make_option
 from functools import partial
+from select import select
 
 
 from thrift import Thrift
@@ -43,14 +49,142 @@ from thrift.transport import TSocket
 from thrift.transport import TTransport
 from thrift.protocol import TBinaryProtocol
 from thrift.server import TServer
+try:
+    from thrift.protocol import fastbinary
+except ImportError:
+    fastbinary = None
+try:
+    from thrift.protocol import TCompactProtocol
+except ImportError:
+    TCompactProtocol = None
 
 from locator.ttypes import *
 from locator import Locator, Base
-from hash_ring import HashRing
+from hash_ring import HashRing, VNODES
 
 DEFAULTPORT = 9900
 WAITPERIOD = 0.01
 SERVICENAME = "locator.Locator"
+WINDOW = 64
+SEPARATOR = ':'
+SMOOTHING = 0.2
+HALFLIFE = 10.0
+JOINWINDOW = 50
+IDLETIMEOUT = 30000
+GRACE = 0.5
+
+# Lanes for calls into a handler: free calls touch no node state and never
+# wait; control calls keep membership going and go ahead of data calls.
+FREE, CONTROL, DATA = 'free', 'control', 'data'
+FREECALLS = set(['ping', 'service_type', 'service_types', 'codec'])
+CONTROLCALLS = set(['add', 'remove', 'reweigh', 'join', 'get_all', 'get_node', 'vnodes',
+                    'die', 'debug'])
+
+TRANSPORTS = {
+    'buffered': TTransport.TBufferedTransportFactory(),
+    'framed': TTransport.TFramedTransportFactory(),
+}
+PROTOCOLS = {'binary': TBinaryProtocol.TBinaryProtocolFactory()}
+if TCompactProtocol:
+    PROTOCOLS['compact'] = TCompactProtocol.TCompactProtocolFactory()
+# The generated code hands accelerated protocols straight to the C codec.
+# That only reads: it can't write the buffers handlers return for values.
+READERS = dict(PROTOCOLS)
+if fastbinary:
+    READERS['binary'] = TBinaryProtocol.TBinaryProtocolAcceleratedFactory()
+
+# first byte of a message in each protocol, used to recognize them
+PROTOCOLIDS = {'\x80': 'binary', '\x82': 'compact'}
+
+codec_settings = dict(transport='buffered', protocol='binary')
+
+def set_codec(option, opt_str, value, parser, setting):
+    codec_settings[setting] = value
+
+# seconds to wait for a connection, or a reply, from another node, to
+# give a request that comes in without a budget of its own, and to wait on
+# a connection in to send something; None is forever
+timeouts = dict(connect=None, read=None, deadline=None, idle=IDLETIMEOUT / 1000.0)
+
+def set_timeout(option, opt_str, value, parser, setting):
+    timeouts[setting] = value / 1000.0
+
+def set_weight(option, opt_str, value, parser):
+    if value != 'auto':
+        try:
+            value = int(value)
+        except ValueError:
+            value = 0
+        if value < 1:
+            raise OptionValueError("%s must be a positive number, or auto" % opt_str)
+    setattr(parser.values, option.dest, value)
+
+def memory_size():
+    "Megabytes of physical memory, or None if the system won't say."
+    try:
+        return os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') >> 20
+    except (AttributeError, ValueError, OSError):
+        return None
+
+# the deadline of the call each serving thread is working on
+current = threading.local()
+
+def begin_call():
+    "Note the arrival of a call on this thread, and give it the default deadline."
+    current.arrived = time()
+    if timeouts['deadline']:
+        current.deadline = current.arrived + timeouts['deadline']
+    else:
+        current.deadline = None
+
+def within(budget):
+    """Hold the call on this thread to the `budget` of milliseconds its
+    caller passed on, counted from its arrival. False if it is already too
+    late to be worth doing."""
+    if budget and hasattr(current, 'arrived'):
+        current.deadline = current.arrived + budget / 1000.0
+    return not too_late()
+
+def lift_deadline():
+    "Let the rest of the call on this thread run for as long as it needs."
+    current.deadline = None
+
+def time_left():
+    "Seconds left for the call on this thread, or None if it has no deadline."
+    deadline = getattr(current, 'deadline', None)
+    if deadline is None:
+        return None
+    return deadline - time()
+
+def too_late():
+    left = time_left()
+    return left is not None and left <= 0
+
+def budget_left():
+    """The milliseconds left for the call on this thread, to pass on with
+    the calls it makes on other nodes; 0 for no limit."""
+    left = time_left()
+    if left is None:
+        return 0
+    return max(1, int(left * 1000))
+
+def read_timeout():
+    "Seconds to wait for a reply: the read timeout, or less if the deadline is sooner."
+    left = time_left()
+    if left is None:
+        return timeouts['read']
+    left = max(left, 0.001)
+    if timeouts['read'] is None:
+        return left
+    return min(timeouts['read'], left)
+
+def describe_codec():
+    "Say which transport and protocol this process uses when calling out."
+    if codec_settings['protocol'] == 'binary' and fastbinary:
+        implementation = 'decoding with the fastbinary C codec'
+    else:
+        implementation = 'pure python'
+    return '%s/%s, %s' % (codec_settings['transport'], codec_settings['protocol'], implementation)
 
 usage = '''
   python %prog [options]
@@ -73,6 +207,51 @@ option_list = [
     make_option("-p", "--port", type="int",
                   help="Use PORT as the server port [default=9900]",
                   default=0),
+    make_option("--transport", type="choice", choices=sorted(TRANSPORTS),
+                  action="callback", callback=set_codec, callback_args=('transport',),
+                  help="Call other nodes over a buffered or framed TRANSPORT [default=buffered]"),
+    make_option("--protocol", type="choice", choices=sorted(PROTOCOLS),
+                  action="callback", callback=set_codec, callback_args=('protocol',),
+                  help="Call other nodes with the %s PROTOCOL [default=binary]"
+                       % ' or '.join(sorted(PROTOCOLS))),
+    make_option("--connect-timeout", type="int", metavar="MS",
+                  action="callback", callback=set_timeout, callback_args=('connect',),
+                  help="Give up connecting to another node after MS milliseconds [default=never]"),
+    make_option("--read-timeout", type="int", metavar="MS",
+                  action="callback", callback=set_timeout, callback_args=('read',),
+                  help="Give up waiting on a reply from another node after MS milliseconds "
+                       "[default=never]"),
+    make_option("--deadline", type="int", metavar="MS",
+                  action="callback", callback=set_timeout, callback_args=('deadline',),
+                  help="Give a request MS milliseconds, including its forwarding to "
+                       "other nodes, unless its caller passed on less [default=no limit]"),
+    make_option("--idle-timeout", type="int", metavar="MS",
+                  action="callback", callback=set_timeout, callback_args=('idle',),
+                  help="Close a connection in that sends nothing for MS milliseconds; "
+                       "0 never does [default=%d]" % IDLETIMEOUT),
+    make_option("--zone",
+                  help="The zone (data centre, say) this node is in, to spread copies "
+                       "across and read from near by",
+                  default=None),
+    make_option("--rack",
+                  help="The rack this node is in, within its zone",
+                  default=None),
+    make_option("-w", "--weight", type="string", action="callback", callback=set_weight,
+                  help="Take a share of keys in proportion to WEIGHT, or to the node's "
+                       "capacity in megabytes with 'auto' [default=the average]",
+                  default=None),
+    make_option("--vnodes", type="int",
+                  help="Hash a node of average weight onto the ring VNODES times; "
+                       "nodes joining a network use its setting [default=%d]" % VNODES,
+                  default=VNODES),
+    make_option("--join-window", type="int", metavar="MS",
+                  help="Gather the nodes joining within MS milliseconds of each other, "
+                       "and redraw the ring once for all of them [default=%d]" % JOINWINDOW,
+                  default=JOINWINDOW),
+    make_option("-S", "--service", action="append", dest="services", metavar="MODULE.CLASS",
+                  help="Also host the service handled by MODULE.CLASS, which is made "
+                       "with the node; may be given more than once",
+                  default=[]),
     make_option("--help", action="help",
                   help="show this help message and exit"),
 ]
@@ -88,6 +267,13 @@ class NodeNotFound(Thrift.TException):
         self.message = message
     
 
+class TimedOut(Thrift.TException):
+    "The node at `location` is there, but didn't answer in time."
+    def __init__(self, location, message=None):
+        self.location = location
+        self.message = message
+    
+
 def loc2str(location):
     "Give the canonical string representation"
     return "%s:%d" % (location.address, location.port)
@@ -96,25 +282,265 @@ def str2loc(location):
     comp = location.rsplit(':', 1)
     return Location(comp[0], int(comp[1]))
 
-def generic_remote_call(clientclass, method, destination, *args):
-    transport = TSocket.TSocket(destination.address, destination.port)
-    transport = TTransport.TBufferedTransport(transport)
-    protocol = TBinaryProtocol.TBinaryProtocol(transport)
-    client = clientclass(protocol)
+def client_protocols(clientclass, transport):
+    "The input and output protocols for a `clientclass` calling over `transport`."
+    iprot = READERS[codec_settings['protocol']].getProtocol(transport)
+    oprot = PROTOCOLS[codec_settings['protocol']].getProtocol(transport)
+    service = getattr(clientclass, 'service', None)
+    if service:
+        oprot = MultiplexedProtocol(oprot, service)
+    return iprot, oprot
+
+def open_socket(destination):
+    """A socket connected to `destination`, that waits no longer than the
+    timeouts allow, and the transport wrapped around it."""
+    sock = TSocket.TSocket(destination.address, destination.port)
+    if timeouts['connect'] is not None:
+        sock.setTimeout(timeouts['connect'] * 1000)
+    transport = TRANSPORTS[codec_settings['transport']].getTransport(sock)
     try:
         transport.open()
     except Thrift.TException, tx:
         raise NodeNotFound(destination)
-    out = getattr(client, method)(*args)
-    transport.close()
-    return out
+    timeout = read_timeout()
+    sock.setTimeout(timeout is not None and timeout * 1000 or None)
+    return sock, transport
+
+class PeerTracker(object):
+    """What this process has seen of each peer: a moving average of the
+    round trips of calls to it, weighted by `smoothing`, how many calls to
+    it are under way, and how many were made lately, halving every
+    `halflife` seconds. Peers are keyed by their canonical strings."""
+    def __init__(self, smoothing=SMOOTHING, halflife=HALFLIFE):
+        self.smoothing = smoothing
+        self.halflife = halflife
+        self.lock = threading.Lock()
+        self.rtts = dict()
+        self.recent = dict()
+        self.inflight = defaultdict(int)
+    
+    def begin(self, peer):
+        self.lock.acquire()
+        self.inflight[peer] += 1
+        self.lock.release()
+    
+    def end(self, peer, rtt=None):
+        "Note a call to `peer` finished, taking `rtt` seconds if it had a reply."
+        now = time()
+        self.lock.acquire()
+        try:
+            self.inflight[peer] -= 1
+            if not self.inflight[peer]:
+                del self.inflight[peer]
+            self.recent[peer] = (self._recent(peer, now) + 1, now)
+            if rtt is not None:
+                if peer in self.rtts:
+                    rtt = self.rtts[peer] + self.smoothing * (rtt - self.rtts[peer])
+                self.rtts[peer] = rtt
+        finally:
+            self.lock.release()
+    
+    def forget(self, peer):
+        self.lock.acquire()
+        self.rtts.pop(peer, None)
+        self.recent.pop(peer, None)
+        self.lock.release()
+    
+    def _recent(self, peer, now):
+        count, at = self.recent.get(peer, (0.0, now))
+        return count * 0.5 ** ((now - at) / self.halflife)
+    
+    def order(self, peers):
+        """`peers` from the best bet to the worst: the round trip, or the
+        average one for a peer not yet called, scaled up by the calls under
+        way and made lately. Close peers are preferred, but the calls
+        spread out among those alike."""
+        now = time()
+        self.lock.acquire()
+        try:
+            if self.rtts:
+                usual = sum(self.rtts.values()) / len(self.rtts)
+            else:
+                usual = 0.0
+            def score(peer):
+                load = 1 + self.inflight.get(peer, 0) + self._recent(peer, now)
+                return (self.rtts.get(peer, usual) * load, peer)
+            return sorted(peers, key=score)
+        finally:
+            self.lock.release()
+    
+    def describe(self):
+        now = time()
+        self.lock.acquire()
+        try:
+            return ['%s: %.2fms, %d under way, %.1f lately'
+                    % (peer, self.rtts.get(peer, 0) * 1000, self.inflight.get(peer, 0),
+                       self._recent(peer, now))
+                    for peer in sorted(set(self.rtts) | set(self.recent))]
+        finally:
+            self.lock.release()
+    
+
+peer_tracker = PeerTracker()
+
+def generic_remote_call(clientclass, method, destination, *args):
+    peer = loc2str(destination)
+    peer_tracker.begin(peer)
+    started = time()
+    rtt = None
+    try:
+        sock, transport = open_socket(destination)
+        client = clientclass(*client_protocols(clientclass, transport))
+        try:
+            result = getattr(client, method)(*args)
+            # oneway calls come straight back, and say nothing of the round trip
+            if hasattr(clientclass, 'recv_' + method):
+                rtt = time() - started
+            return result
+        except socket.timeout:
+            rtt = time() - started
+            raise TimedOut(destination, '%s timed out' % method)
+        finally:
+            # a server serves one connection at a time, so never leave one open
+            transport.close()
+    finally:
+        peer_tracker.end(peer, rtt)
+
+class PipelinedClient(object):
+    """Sends calls to `destination` without waiting for each reply, keeping
+    up to `window` of them in flight on one connection, and matches replies
+    to calls by sequence id, whatever order they come back in. Oneway
+    calls have no reply, and their outcome is None as soon as they are sent.
+    A connection that breaks raises NodeNotFound, and one too slow TimedOut,
+    with whatever was still in flight lost.
+    
+    The replies to a whole window have to fit in the socket buffers while
+    the calls are still going out, so keep `window` small for calls with
+    large results.
+    """
+    def __init__(self, clientclass, destination, window=WINDOW):
+        self.clientclass = clientclass
+        self.destination = destination
+        self.window = window
+        self.socket, self.transport = open_socket(destination)
+        self.iprot, self.oprot = client_protocols(clientclass, self.transport)
+        self.seqid = 0
+        self.unsent = 0
+        self.pending = dict()
+        self.results = dict()
+    
+    def generated(self, name):
+        "The generated class `name`, from the module of whichever service defines it."
+        for cls in inspect.getmro(self.clientclass):
+            module = sys.modules[cls.__module__]
+            if hasattr(module, name):
+                return getattr(module, name)
+        raise AttributeError(name)
+    
+    def call(self, method, *args):
+        "Send off a call to `method`, and give back its sequence id."
+        while len(self.pending) >= self.window:
+            self.receive()
+        self.seqid += 1
+        try:
+            # a full write buffer goes out on its own, so this can fail too
+            self.oprot.writeMessageBegin(method, Thrift.TMessageType.CALL, self.seqid)
+            self.generated(method + '_args')(*args).write(self.oprot)
+            self.oprot.writeMessageEnd()
+        except socket.timeout:
+            raise TimedOut(self.destination, 'calls not taken in time')
+        except (socket.error, TTransport.TTransportException), tx:
+            raise NodeNotFound(self.destination, str(tx))
+        self.unsent += 1
+        if hasattr(self.clientclass, 'recv_' + method):
+            self.pending[self.seqid] = method
+        else:
+            self.results[self.seqid] = None
+        return self.seqid
+    
+    def flush(self):
+        if self.unsent:
+            try:
+                self.transport.flush()
+            except socket.timeout:
+                raise TimedOut(self.destination, 'calls not taken in time')
+            except (socket.error, TTransport.TTransportException), tx:
+                raise NodeNotFound(self.destination, str(tx))
+            self.unsent = 0
+    
+    def receive(self):
+        """Read the next reply and keep its outcome: the result, an exception
+        the call raised, or a TApplicationException if it failed outright."""
+        self.flush()
+        try:
+            (fname, mtype, rseqid) = self.iprot.readMessageBegin()
+            method = self.pending.pop(rseqid)
+            if mtype == Thrift.TMessageType.EXCEPTION:
+                outcome = Thrift.TApplicationException()
+                outcome.read(self.iprot)
+            else:
+                result = self.generated(method + '_result')()
+                result.read(self.iprot)
+                outcome = getattr(result, 'success', None)
+                for spec in result.thrift_spec[1:]:
+                    if spec and getattr(result, spec[2]) is not None:
+                        outcome = getattr(result, spec[2])
+            self.iprot.readMessageEnd()
+        except socket.timeout:
+            raise TimedOut(self.destination, 'no reply in time')
+        except (socket.error, TTransport.TTransportException), tx:
+            # the peer went away part way through
+            raise NodeNotFound(self.destination, str(tx))
+        self.results[rseqid] = outcome
+        return rseqid
+    
+    def wait(self):
+        "Wait for all the replies, and give back their outcomes by sequence id."
+        self.flush()
+        while self.pending:
+            self.receive()
+        results, self.results = self.results, dict()
+        return results
+    
+    def fileno(self):
+        "So that replies can be waited on with select()."
+        return self.socket.handle.fileno()
+    
+    def close(self):
+        self.transport.close()
+    
+
+class MultiplexedProtocol(object):
+    """Names the service each call is for, as "service:method", and
+    otherwise passes everything on to `protocol`."""
+    def __init__(self, protocol, service):
+        self.protocol = protocol
+        self.service = service
+    
+    def __getattr__(self, name):
+        return getattr(self.protocol, name)
+    
+    def writeMessageBegin(self, name, type, seqid):
+        if type in (Thrift.TMessageType.CALL, Thrift.TMessageType.ONEWAY):
+            name = self.service + SEPARATOR + name
+        self.protocol.writeMessageBegin(name, type, seqid)
+    
+
+def multiplexed(clientclass, service=None):
+    """A version of the generated `clientclass` that names its service in
+    every call, for nodes that host more than one. The service is the
+    module `clientclass` was generated in, e.g. "diststore.Store"."""
+    class Client(clientclass):
+        pass
+    Client.service = service or clientclass.__module__
+    return Client
 
 remote_call = partial(generic_remote_call, Locator.Client)
 ping = partial(generic_remote_call, Base.Client, 'ping')
 
 def select_peers(in_set):
-    lst = sorted(in_set)
-    return lst
+    "The peers in `in_set`, nearest and least called on first."
+    return peer_tracker.order(in_set)
 
 def find_matching_service(location, service, maximum=10):
     loc = Location(location.address, location.port)
@@ -154,12 +580,487 @@ def ping_until_return(location, maximum=10):
     for a in range(maximum):
         try:
             return ping(loc)
-        except NodeNotFound:
+        except (NodeNotFound, TimedOut):
             sleep(wait)
             wait *= 2
             print wait
     raise NodeNotFound(loc)
 
+class PrefixedTransport(TTransport.TTransportBase):
+    "Gives back bytes already read from `trans` before reading on from it."
+    def __init__(self, trans, prefix):
+        self.trans = trans
+        self.prefix = prefix
+    
+    def isOpen(self):
+        return self.trans.isOpen()
+    
+    def open(self):
+        return self.trans.open()
+    
+    def close(self):
+        return self.trans.close()
+    
+    def read(self, sz):
+        if self.prefix:
+            out, self.prefix = self.prefix[:sz], self.prefix[sz:]
+            return out
+        return self.trans.read(sz)
+    
+    def write(self, buf):
+        self.trans.write(buf)
+    
+    def flush(self):
+        self.trans.flush()
+    
+
+class SniffingTransportFactory(object):
+    """A server's transport factory that works out from its first bytes
+    which transport and protocol each connection uses, so that a node
+    answers its peers however they were configured.
+    
+    A message starts with a protocol id byte; a frame starts with a 4-byte
+    length, and then such a byte.
+    """
+    def __init__(self):
+        self.pending = dict()
+    
+    def getTransport(self, client):
+        # called for the input side and then the output side; both share one transport
+        if id(client) in self.pending:
+            return self.pending.pop(id(client))
+        try:
+            prefix = client.readAll(1)
+            if prefix in PROTOCOLIDS:
+                transport = 'buffered'
+            else:
+                prefix += client.readAll(4)
+                transport = 'framed'
+            protocol = PROTOCOLIDS.get(prefix[-1], 'binary')
+        except TTransport.TTransportException:
+            # closed without a word; let the server find out for itself
+            prefix, transport, protocol = '', 'buffered', 'binary'
+        trans = TRANSPORTS[transport].getTransport(PrefixedTransport(client, prefix))
+        trans.protocol = protocol
+        self.pending[id(client)] = trans
+        return trans
+    
+
+class SniffedProtocolFactory(object):
+    "Gives each sniffed transport a protocol from `protocols` to match."
+    def __init__(self, protocols):
+        self.protocols = protocols
+    
+    def getProtocol(self, trans):
+        return self.protocols[trans.protocol].getProtocol(trans)
+    
+
+def lane(method):
+    if method in FREECALLS:
+        return FREE
+    if method in CONTROLCALLS:
+        return CONTROL
+    return DATA
+
+class Lanes(object):
+    """Lets the threads serving a node's connections take turns on its
+    handlers. One call at a time has the node; a waiting control call gets
+    it before any waiting data call, and a free call doesn't wait at all.
+    So a node busy with data still answers its peers' pings, and takes in
+    membership changes as soon as the call in hand is done.
+    
+    Data calls wait in line, each holding a ticket. A call gets one when
+    its header has been read, unless its connection was given one already:
+    as each connection is accepted, every connection already in, that has
+    since sent something for its next call, gets a ticket in the order
+    they were accepted (see `LaneServer`). So calls sent one after another,
+    a oneway put and then a get, say, are served in the order they were
+    sent, as they were by the single-threaded server. A connection that is
+    open but says nothing holds up no one, and one given a ticket has
+    `grace` seconds at the front of the line to get its header in before
+    the line moves on without it."""
+    def __init__(self, grace=GRACE):
+        self.grace = grace
+        self.lock = threading.Lock()
+        self.turn = threading.Condition(self.lock)
+        self.busy = False
+        self.controls = 0
+        self.issued = 0
+        self.serving = 0
+        self.forgone = set()
+        self.places = []
+        # tickets given to connections whose calls haven't come in yet
+        self.unclaimed = dict()
+    
+    def run(self, lane, func, *args):
+        ticket = self.arrive()
+        if lane == FREE:
+            self.forgo(ticket)
+            return func(*args)
+        self.take(lane, ticket)
+        current.lanes = (self, lane)
+        try:
+            return func(*args)
+        finally:
+            current.lanes = None
+            self.give()
+    
+    def open(self, place):
+        """Count in the connection at `place`, just accepted, and give a
+        ticket to each connection between calls that has something for its
+        next one, oldest first."""
+        self.lock.acquire()
+        try:
+            self.places.append(place)
+            waiting = [p for p in self.places
+                       if p.waiting and p.ticket is None and not p.passed]
+            ready = readable([p.sock for p in waiting if not p.heard])
+            for p in waiting:
+                if p.heard or p.sock in ready:
+                    p.ticket = self.issued
+                    self.unclaimed[p.ticket] = (p, None)
+                    self.issued += 1
+        finally:
+            self.lock.release()
+    
+    def expect(self, place):
+        "Note that the connection at `place` is between calls."
+        self.lock.acquire()
+        place.waiting = True
+        place.heard = False
+        place.passed = False
+        self.lock.release()
+    
+    def arrive(self):
+        """Note that the call on this thread's connection has been read as
+        far as its header, and give back the ticket the connection was
+        given for it, if any."""
+        place = getattr(current, 'place', None)
+        if place is None or not place.waiting:
+            return None
+        self.lock.acquire()
+        place.waiting = False
+        ticket, place.ticket = place.ticket, None
+        self.unclaimed.pop(ticket, None)
+        self.lock.release()
+        return ticket
+    
+    def close(self, place):
+        "Count out the connection at `place`, giving up its ticket if it has one."
+        self.lock.acquire()
+        self.places.remove(place)
+        ticket, place.ticket = place.ticket, None
+        self.unclaimed.pop(ticket, None)
+        self.lock.release()
+        self.forgo(ticket)
+    
+    def forgo(self, ticket):
+        "Give up `ticket`, for a call that doesn't need it."
+        if ticket is None:
+            return
+        self.lock.acquire()
+        self.forgone.add(ticket)
+        self._advance()
+        self.lock.release()
+    
+    def _advance(self):
+        "Move the line past the tickets given up; call with the lock held."
+        if self.serving in self.forgone:
+            while self.serving in self.forgone:
+                self.forgone.remove(self.serving)
+                self.serving += 1
+            self.turn.notifyAll()
+    
+    def take(self, lane, ticket=None):
+        "Wait for a turn on the node in `lane`, with `ticket` if it was given one."
+        if lane != DATA:
+            self.forgo(ticket)
+        self.lock.acquire()
+        try:
+            if lane == CONTROL:
+                self.controls += 1
+                while self.busy:
+                    self.turn.wait()
+                self.controls -= 1
+            else:
+                if ticket is None:
+                    ticket = self.issued
+                    self.issued += 1
+                while True:
+                    left = self._overdue()
+                    if not (self.busy or self.controls or ticket != self.serving):
+                        break
+                    self.turn.wait(left)
+                self.serving += 1
+                self._advance()
+            self.busy = True
+        finally:
+            self.lock.release()
+    
+    def _overdue(self):
+        """Move the line past the ticket being served if its connection has
+        been at the front for longer than its grace without its call coming
+        in, and give back the seconds it has left, or None; call with the
+        lock held."""
+        while self.serving in self.unclaimed:
+            place, due = self.unclaimed[self.serving]
+            if due is None:
+                due = time() + self.grace
+                self.unclaimed[self.serving] = (place, due)
+            left = due - time()
+            if left > 0:
+                return left
+            # its call gets a ticket at the back of the line when it does come
+            del self.unclaimed[self.serving]
+            place.ticket = None
+            place.passed = True
+            self.forgone.add(self.serving)
+            self._advance()
+        return None
+    
+    def give(self):
+        self.lock.acquire()
+        self.busy = False
+        self.turn.notifyAll()
+        self.lock.release()
+    
+
+def readable(socks):
+    "Those of the TSockets `socks` with something to read, or closed, right now."
+    if not socks:
+        return set()
+    try:
+        ready = set(select([sock.handle for sock in socks], [], [], 0)[0])
+    except ValueError:
+        # more descriptors than select takes: calls go in header order instead
+        return set()
+    return set(sock for sock in socks if sock.handle in ready)
+
+class Place(TTransport.TTransportBase):
+    """A connection in, read through this so as to know when something has
+    come in on it: whether it is between calls, whether anything of its
+    next call has been read, the ticket it was given, if any, and whether
+    the line has moved on without it."""
+    def __init__(self, sock):
+        self.sock = sock
+        self.waiting = True
+        self.heard = False
+        self.ticket = None
+        self.passed = False
+    
+    def isOpen(self):
+        return self.sock.isOpen()
+    
+    def open(self):
+        return self.sock.open()
+    
+    def close(self):
+        return self.sock.close()
+    
+    def read(self, sz):
+        buff = self.sock.read(sz)
+        self.heard = True
+        return buff
+    
+    def write(self, buf):
+        self.sock.write(buf)
+    
+    def flush(self):
+        self.sock.flush()
+    
+
+class LaneServer(TServer.TThreadedServer):
+    """Serves each connection on its own thread, like TThreadedServer, but
+    counts it in to `processor.lanes` as it is accepted, so that calls are
+    served in the order they were sent (see `Lanes`). A connection that
+    sends nothing for the idle timeout is closed, so that a client gone
+    quiet, or half open, doesn't keep its thread, or a call it is part way
+    through sending, for ever."""
+    def serve(self):
+        self.serverTransport.listen()
+        while True:
+            try:
+                client = self.serverTransport.accept()
+                if not client:
+                    continue
+                if timeouts['idle']:
+                    client.setTimeout(timeouts['idle'] * 1000)
+                place = Place(client)
+                self.processor.lanes.open(place)
+                t = threading.Thread(target=self.handle, args=(place,))
+                t.setDaemon(self.daemon)
+                t.start()
+            except KeyboardInterrupt:
+                raise
+            except Exception, x:
+                print 'accept failed: %s' % x
+    
+    def handle(self, place):
+        lanes = self.processor.lanes
+        current.place = place
+        try:
+            itrans = self.inputTransportFactory.getTransport(place)
+            otrans = self.outputTransportFactory.getTransport(place)
+            iprot = self.inputProtocolFactory.getProtocol(itrans)
+            oprot = self.outputProtocolFactory.getProtocol(otrans)
+            while True:
+                self.processor.process(iprot, oprot)
+                lanes.expect(place)
+        except (TTransport.TTransportException, socket.error):
+            # closed, or quiet for too long
+            pass
+        except Exception:
+            traceback.print_exc()
+        finally:
+            current.place = None
+            lanes.close(place)
+        place.close()
+    
+
+def aside(func, *args):
+    """Run `func` without holding the node, for the part of a call that
+    only waits on other nodes, then take a turn again. Other calls have the
+    node meanwhile, so anything read from it before may have changed."""
+    held = getattr(current, 'lanes', None)
+    if held is None:
+        return func(*args)
+    lanes, lane = held
+    current.lanes = None
+    lanes.give()
+    try:
+        return func(*args)
+    finally:
+        lanes.take(lane)
+        current.lanes = held
+
+
+class Flight(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+    
+
+class SingleFlight(object):
+    """Lets calls that want the same thing at the same time share one
+    call for it. The first to ask for `key` makes the call, off the node
+    (see `aside`); the rest wait for it and get the same outcome."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = dict()
+        self.shared = 0
+    
+    def do(self, key, func, *args):
+        self.lock.acquire()
+        try:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = Flight()
+            else:
+                self.shared += 1
+        finally:
+            self.lock.release()
+        if leader:
+            try:
+                flight.result = aside(func, *args)
+            except Exception, ex:
+                flight.error = ex
+            finally:
+                self.lock.acquire()
+                del self.flights[key]
+                self.lock.release()
+                flight.done.set()
+        elif not aside(flight.done.wait, time_left()):
+            raise TimedOut(None, 'gave up waiting on a shared call')
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+    
+
+class MultiplexedProcessor(object):
+    """Serves several services from one port. A call named "service:method"
+    goes to the processor registered for that service; a plain "method"
+    goes to the `default` processor, so clients that name no service work
+    as before. Calls are run in their lane (see `Lanes`)."""
+    def __init__(self, default):
+        self.default = default
+        self.processors = dict()
+        self.lanes = Lanes()
+    
+    def register(self, service, processor):
+        self.processors[service] = processor
+    
+    def process(self, iprot, oprot):
+        (name, type, seqid) = iprot.readMessageBegin()
+        service, separator, method = name.rpartition(SEPARATOR)
+        if separator:
+            processor = self.processors.get(service)
+        else:
+            processor = self.default
+        begin_call()
+        if processor is None or method not in processor._processMap:
+            self.lanes.forgo(self.lanes.arrive())
+            iprot.skip(Thrift.TType.STRUCT)
+            iprot.readMessageEnd()
+            x = Thrift.TApplicationException(Thrift.TApplicationException.UNKNOWN_METHOD,
+                                             'Unknown function %s' % (name))
+            oprot.writeMessageBegin(name, Thrift.TMessageType.EXCEPTION, seqid)
+            x.write(oprot)
+            oprot.writeMessageEnd()
+            oprot.trans.flush()
+            return
+        # straight to the generated method, so the protocol keeps its C codec
+        self.lanes.run(lane(method), processor._processMap[method], processor, seqid, iprot, oprot)
+        return True
+    
+
+def service_of(handlerclass):
+    "The generated service module a handler class implements the Iface of."
+    for base in handlerclass.__bases__:
+        if base.__name__ == 'Iface':
+            return sys.modules[base.__module__]
+    for base in handlerclass.__bases__:
+        try:
+            return service_of(base)
+        except ValueError:
+            pass
+    raise ValueError('%s implements no thrift service' % handlerclass.__name__)
+
+def host(node, services=()):
+    """A processor for all of `node`'s services, and for the services in
+    `services`: handler classes, or their "module.Class" names, each made
+    with `node` so that it can use the node's ring. Calls that name no
+    service go to the node's own most derived service."""
+    processor = MultiplexedProcessor(service_of(node.__class__).Processor(node))
+    for service in node.service_types():
+        processor.register(service, sys.modules[service].Processor(node))
+    for handlerclass in services:
+        if isinstance(handlerclass, basestring):
+            module, name = handlerclass.rsplit('.', 1)
+            handlerclass = getattr(__import__(module, fromlist=[name]), name)
+        service = service_of(handlerclass)
+        processor.register(service.__name__, service.Processor(handlerclass(node)))
+        print 'hosting %s' % service.__name__
+    return processor
+
+def serve(server):
+    """Run `server` on a thread of its own, leaving the main thread free to
+    take signals (SIGINT, SIGUSR1, `die()`) as soon as they arrive."""
+    serving = threading.Thread(target=server.serve)
+    serving.setDaemon(True)
+    serving.start()
+    while serving.isAlive():
+        serving.join(1.0)
+
+def server_factories():
+    """The input and output transport and protocol factories for a server
+    that answers in whatever transport and protocol it is called with."""
+    transports = SniffingTransportFactory()
+    return (transports, transports,
+            SniffedProtocolFactory(READERS), SniffedProtocolFactory(PROTOCOLS))
+
+
 class BaseHandler(Base.Iface):
     @classmethod
     def service_type(cls):
@@ -182,16 +1083,30 @@ class BaseHandler(Base.Iface):
     def ping(self):
         print 'ping()'
     
+    def codec(self):
+        return describe_codec()
+    
     def die(self):
-        raise KeyboardInterrupt
+        # calls are served on their own threads; stop the server's
+        thread.interrupt_main()
     
 
 class LocatorHandler(BaseHandler, Locator.Iface):
-    def __init__(self, peer=None, port=DEFAULTPORT):
+    def __init__(self, peer=None, port=DEFAULTPORT, zone=None, rack=None, weight=None,
+                 vnodes=VNODES, join_window=JOINWINDOW):
         self.address = socket.gethostbyname(socket.gethostname())
         self.port = port
+        self.zone = zone
+        self.rack = rack
+        if weight == 'auto':
+            weight = memory_size()
+        self.weight = weight
         self.peer = peer
-        self.ring = HashRing()
+        self.ring = HashRing(vnodes=vnodes)
+        self.places = dict()
+        self.join_window = join_window / 1000.0
+        self.joining = dict()
+        self.gathering = False
         try:
             ping(self.location)
             print 'Uh-oh. Our location responded to a ping!'
@@ -207,7 +1122,52 @@ class LocatorHandler(BaseHandler, Locator.Iface):
     @property
     def location(self):
         "Give the canonical Location"
-        return Location(address=self.address, port=self.port)
+        return Location(address=self.address, port=self.port, zone=self.zone, rack=self.rack,
+                        weight=self.weight)
+    
+    def place(self, location):
+        "Remember where the node at `location` sits, and its weight, if it says."
+        key = loc2str(location)
+        self.places[key] = location
+        if location.weight:
+            self.ring.weights[key] = location.weight
+    
+    def locate(self, node):
+        "The Location of `node`, a canonical string, with its zone and rack if known."
+        return self.places.get(node) or str2loc(node)
+    
+    def members(self):
+        "The nodes in the ring, and those waiting to be taken into it."
+        return self.ring.nodes.union(self.joining)
+    
+    def admit(self, location):
+        """Take the node at `location` into the ring, along with any others
+        that join within the join window, so that a rack of nodes
+        starting at once redraws the ring once rather than once apiece."""
+        self.place(location)
+        self.joining[loc2str(location)] = location
+        held = getattr(current, 'lanes', None)
+        if not self.join_window or held is None:
+            self.settle_joins()
+        elif not self.gathering:
+            self.gathering = True
+            timer = threading.Timer(self.join_window, held[0].run, (CONTROL, self.settle_joins))
+            timer.daemon = True
+            timer.start()
+    
+    def settle_joins(self):
+        "Take the nodes waiting to join into the ring, in one go. Returns their Locations."
+        # membership changes are always made, however long they take
+        lift_deadline()
+        self.gathering = False
+        joined = self.joining.values()
+        self.joining = dict()
+        fresh = [key for key in map(loc2str, joined) if key not in self.ring.nodes]
+        if fresh:
+            self.ring.extend(fresh)
+        for location in joined:
+            print "added %s:%d" % (location.address, location.port)
+        return joined
     
     def join(self, location):
         """
@@ -218,73 +1178,143 @@ class LocatorHandler(BaseHandler, Locator.Iface):
         ping_until_return(location)
         items = self.ring.nodes.difference([loc2str(location)])
     
-    def remove(self, location, authorities):
+    def remove(self, location, authorities, budget=0):
         """
         Parameters:
          - location
          - authorities
+         - budget: milliseconds left to finish in, or 0 for no limit
         """
+        # however late, membership changes are always made and passed on
+        within(budget)
         key = loc2str(location)
         self.ring.remove(loc2str(location))
+        self.joining.pop(key, None)
+        self.places.pop(key, None)
+        peer_tracker.forget(key)
         authorities.append(self.location)
-        destinations = select_peers(self.ring.nodes.difference(map(loc2str,authorities)))
+        destinations = select_peers(self.members().difference(map(loc2str,authorities)))
         for destination in destinations:
             try:
-                remote_call('remove', str2loc(destination), location, authorities)
+                remote_call('remove', str2loc(destination), location, authorities, budget_left())
                 break
+            except TimedOut:
+                pass
             except NodeNotFound, tx:
                 # enter all nodes as authorities to avoid race conditions
                 # lazy invalidation
-                self.remove(tx.location, map(str2loc, self.ring.nodes))
+                self.remove(tx.location, map(str2loc, self.members()))
         print "removed %s:%d" % (location.address, location.port)
     
-    def add(self, location, authorities):
+    def add(self, location, authorities, budget=0):
         """
         Parameters:
          - location
          - authorities
+         - budget: milliseconds left to finish in, or 0 for no limit
         """
+        within(budget)
         key = loc2str(location)
         authorities.append(self.location)
-        destinations = select_peers(self.ring.nodes.difference(map(loc2str,authorities)))
+        destinations = select_peers(self.members().difference(map(loc2str,authorities)))
         for destination in destinations:
             try:
-                remote_call('add', str2loc(destination), location, authorities)
+                remote_call('add', str2loc(destination), location, authorities, budget_left())
                 break
+            except TimedOut:
+                pass
             except NodeNotFound, tx:
                 # enter all nodes as authorities to avoid race conditions
                 # lazy invalidation
-                self.remove(tx.location, map(str2loc, self.ring.nodes))
-        self.ring.append(loc2str(location))
-        print "added %s:%d" % (location.address, location.port)
+                self.remove(tx.location, map(str2loc, self.members()))
+        self.admit(location)
+    
+    def reweigh(self, location, authorities, budget=0):
+        """
+        Parameters:
+         - location: the node, with its new weight
+         - authorities
+         - budget: milliseconds left to finish in, or 0 for no limit
+        """
+        within(budget)
+        key = loc2str(location)
+        authorities.append(self.location)
+        destinations = select_peers(self.members().difference(map(loc2str,authorities)))
+        for destination in destinations:
+            try:
+                remote_call('reweigh', str2loc(destination), location, authorities, budget_left())
+                break
+            except TimedOut:
+                pass
+            except NodeNotFound, tx:
+                self.remove(tx.location, map(str2loc, self.members()))
+        if key not in self.members() or not location.weight > 0:
+            return
+        if key == self.here:
+            self.weight = location.weight
+        # keep its zone and rack
+        place = self.locate(key)
+        place.weight = location.weight
+        self.places[key] = place
+        self.ring.reweigh(key, location.weight)
+        print "reweighed %s to %d" % (key, location.weight)
     
     def get_all(self):
-        return map(str2loc, self.ring.nodes)
+        return map(self.locate, self.members())
     
     def get_node(self, key):
         if self.ring.nodes:
-            return str2loc(self.ring.get_node(key))
+            return self.locate(self.ring.get_node(key))
         else:
             return Location('',0)
     
+    def vnodes(self):
+        return self.ring.vnodes
+    
+    def ring_stats(self, vnodes):
+        """
+        Parameters:
+         - vnodes: the virtual nodes to analyse the ring with, or 0 for its own
+        """
+        if vnodes < 1:
+            vnodes = self.ring.vnodes
+        nodes, weights = set(self.ring.nodes), dict(self.ring.weights)
+        # worked out on a copy, without holding the node: it redraws rings
+        def balance():
+            return HashRing(nodes, weights, vnodes).balance()
+        return RingStats(vnodes=vnodes, **aside(balance))
+    
     def debug(self):
         a = "self.location: %r\n" % self.location
         a += "self.ring.nodes:\n%r\n" % self.ring.nodes
+        a += "peers:\n%s\n" % '\n'.join(peer_tracker.describe())
         print a
     
     def cleanup(self):
         self.ring.remove(self.here)
         for node in select_peers(self.ring.nodes):
             try:
-                remote_call('remove', str2loc(node), self.location, [self.location])
+                remote_call('remove', str2loc(node), self.location, [self.location], 0)
                 break
             except NodeNotFound, tx:
                 pass
     
     def local_join(self):
+        self.place(self.location)
         self.ring.append(self.here)
         if self.peer:
-            self.ring.extend(map(loc2str, remote_call('get_all', self.peer)))
+            try:
+                vnodes = remote_call('vnodes', self.peer)
+            except Thrift.TApplicationException:
+                vnodes = VNODES
+            if vnodes != self.ring.vnodes:
+                # every node has to draw the same ring
+                print 'Using the network\'s %d virtual nodes, not %d' % (vnodes, self.ring.vnodes)
+                self.ring.vnodes = vnodes
+            peers = remote_call('get_all', self.peer)
+            for peer in peers:
+                self.place(peer)
+            self.ring.extend(map(loc2str, peers))
             remote_call('join', self.peer, self.location)
             print 'Joining the network...'
         else:
@@ -293,24 +1323,27 @@ class LocatorHandler(BaseHandler, Locator.Iface):
     
 
 def main(inputargs):
+    services = inputargs.pop('services')
     handler = LocatorHandler(**inputargs)
-    processor = Locator.Processor(handler)
+    processor = host(handler, services)
     transport = TSocket.TServerSocket(handler.port)
-    tfactory = TTransport.TBufferedTransportFactory()
-    pfactory = TBinaryProtocol.TBinaryProtocolFactory()
-    server = TServer.TSimpleServer(processor, transport, tfactory, pfactory)
+    server = LaneServer(processor, transport, *server_factories(), daemon=True)
     
     handler.local_join()
     
-    print 'Starting the server at %s...' % (handler.here)
+    print 'Starting the server at %s (%s)...' % (handler.here, describe_codec())
     try:
-        server.serve()
+        serve(server)
     finally:
-        handler.cleanup()
+        processor.lanes.run(CONTROL, handler.cleanup)
     print 'done.'
 
 if __name__ == '__main__':
     (options, args) = parser.parse_args()
+    del options.transport, options.protocol
+    del options.connect_timeout, options.read_timeout, options.deadline, options.idle_timeout
+    if options.vnodes < 1:
+        parser.error("--vnodes must be at least 1")
     if not options.port:
         loc = ping_until_not_found(Location('localhost', DEFAULTPORT), 40)
         options.port = loc.port
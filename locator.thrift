@@ -29,11 +29,25 @@ THE SOFTWARE.
 struct Location {
  1: string address,
  2: i16 port,
+ 3: string zone,
+ 4: string rack,
+ 5: i32 weight,
+}
+
+struct RingStats {
+ 1: i32 vnodes,
+ 2: i32 points,
+ 3: map<string,double> ownership,
+ 4: double stddev,
+ 5: double max_mean,
+ 6: double join_moves,
+ 7: map<string,double> leave_moves,
 }
 
 service Base {
  void           ping         ()
  string         service_type ()
+ string         codec        ()
  list<string>   service_types()
  oneway void    debug        ()
  oneway void    die          ()
@@ -41,8 +55,11 @@ service Base {
 
 service Locator extends Base {
  oneway void    join    (1:Location location)
- oneway void    remove  (1:Location location, 2:list<Location> authorities)
- oneway void    add     (1:Location location, 2:list<Location> authorities)
+ oneway void    remove  (1:Location location, 2:list<Location> authorities, 3:i32 budget)
+ oneway void    add     (1:Location location, 2:list<Location> authorities, 3:i32 budget)
+ oneway void    reweigh (1:Location location, 2:list<Location> authorities, 3:i32 budget)
  list<Location> get_all ()
  Location       get_node(1:string key)
+ i32            vnodes  ()
+ RingStats      ring_stats(1:i32 vnodes)
 }
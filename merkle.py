@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+merkle.py
+
+Hash trees for anti-entropy. Each tree summarizes the items on one arc of
+the ring; two nodes compare trees from the root down to find the few keys
+they disagree on, instead of shipping everything.
+
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import md5
+
+DEPTH = 6
+
+def digest(key, value):
+    "A 128-bit summary of one item."
+    m = md5.new(key)
+    m.update('\x00')
+    m.update(value)
+    return long(m.hexdigest(), 16)
+
+class MerkleTree(object):
+    def __init__(self, depth=DEPTH):
+        """A binary tree with 2**`depth` leaves. Nodes are numbered heap
+        fashion: 1 is the root, and node n has children 2n and 2n+1.
+        """
+        self.depth = depth
+        self.first_leaf = 1 << depth
+        self.hashes = [0L] * (2 << depth)
+        self.leaves = dict()
+
+    def __len__(self):
+        return sum(len(items) for items in self.leaves.itervalues())
+
+    def keys(self):
+        for items in self.leaves.itervalues():
+            for key in items:
+                yield key
+
+    def leaf(self, key):
+        "The leaf node holding `key`."
+        # the leading hex digits already fix the ring arc, so spread on later ones
+        return self.first_leaf + (int(md5.new(key).hexdigest()[8:16], 16) >> (32 - self.depth))
+
+    def update(self, key, value):
+        self._set(key, digest(key, value))
+
+    def discard(self, key):
+        self._set(key, 0L)
+
+    def _set(self, key, new):
+        node = self.leaf(key)
+        items = self.leaves.setdefault(node, dict())
+        old = items.pop(key, 0L)
+        if new:
+            items[key] = new
+        elif not items:
+            del self.leaves[node]
+        delta = old ^ new
+        # a node's hash is the xor of everything below it, so an update
+        # only has to touch the path back up to the root
+        while node and delta:
+            self.hashes[node] ^= delta
+            node >>= 1
+
+    def is_leaf(self, node):
+        return node >= self.first_leaf
+
+    def hash(self, node):
+        return '%032x' % self.hashes[node]
+
+    def items(self, node):
+        "The item digests under leaf `node`, by key."
+        return dict((key, '%032x' % value) for key, value in self.leaves.get(node, {}).iteritems())
+
+    def __repr__(self):
+        return '<MerkleTree %s: %d keys>' % (self.hash(1), len(self))
+
+
+def differing(tree, remote_hashes, remote_items):
+    """Compare `tree` with a remote copy and give the keys it holds that the
+    remote does not, or holds with a different value. `remote_hashes(nodes)`
+    and `remote_items(nodes)` fetch the remote side's hashes and leaf items,
+    so the walk takes one round trip per level, and only descends where
+    the two trees disagree.
+    """
+    if not tree.hashes[1]:
+        return []
+    frontier = [1]
+    while True:
+        theirs = remote_hashes(frontier)
+        frontier = [node for node, other in zip(frontier, theirs)
+                    if tree.hash(node) != other]
+        if not frontier or tree.is_leaf(frontier[0]):
+            break
+        frontier = [child for node in frontier
+                    for child in (2 * node, 2 * node + 1) if tree.hashes[child]]
+    if not frontier:
+        return []
+    theirs = remote_items(frontier)
+    keys = []
+    for node in frontier:
+        for key, value in tree.items(node).iteritems():
+            if theirs.get(key) != value:
+                keys.append(key)
+    return keys
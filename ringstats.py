@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+ringstats.py
+
+Asks a node how evenly its ring shares out the key space, as it is, or as 
+it would with a different number of virtual nodes.
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import sys
+sys.path.append('gen-py')
+
+from locator.ttypes import Location
+from storeserver import remote_call, parser, DEFAULTPORT, SERVICENAME
+from location import find_matching_service, str2loc
+
+usage = '''
+  python %prog [options]
+
+Looks for a storage node at PEER, either as specified, or 
+auto-discovered on the localhost starting from the default 
+port. Prints each node's share of the key space and how much 
+of it would move should the node leave, then how uneven the 
+shares are and how much would move should a node join. With 
+--vnodes, works it out for that many virtual nodes instead.'''
+
+parser.set_usage(usage)
+parser.remove_option('--port')
+parser.set_defaults(vnodes=0)
+
+if __name__ == '__main__':
+    (options, args) = parser.parse_args()
+    if args:
+        parser.error("incorrect number of arguments")
+    if options.vnodes < 0:
+        parser.error("--vnodes must not be negative")
+    if options.peer:
+        loc = str2loc(options.peer)
+    else:
+        loc = find_matching_service(Location('localhost', DEFAULTPORT), SERVICENAME) or sys.exit()
+    stats = remote_call('ring_stats', loc, options.vnodes)
+    print '%-24s %9s %9s' % ('node', 'share', 'on leave')
+    for node in sorted(stats.ownership):
+        print '%-24s %8.2f%% %8.2f%%' % (node, 100 * stats.ownership[node],
+                                         100 * stats.leave_moves[node])
+    print
+    print 'virtual nodes:  %d (%d ring points)' % (stats.vnodes, stats.points)
+    print 'stddev:         %.4f of a fair share' % stats.stddev
+    print 'max/mean:       %.4f' % stats.max_mean
+    print 'moved on join:  %.2f%%' % (100 * stats.join_moves)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+sketch.py
+
+Streaming request statistics in small, fixed memory: a count-min sketch,
+the heavy hitters it reveals, and a histogram of requests by ring point.
+
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import md5
+from array import array
+from collections import defaultdict
+
+WIDTH = 1024
+DEPTH = 4
+TOPK = 32
+HALFLIFE = 100000
+
+class CountMinSketch(object):
+    def __init__(self, width=WIDTH, depth=DEPTH):
+        """Estimates how often each key was seen in `depth` rows of `width`
+        counters. Estimates never fall short, and overshoot by at most
+        e/width of the total with probability 1 - exp(-depth).
+        """
+        if not 0 < depth <= 4:
+            raise ValueError('depth must be between 1 and 4')
+        self.width = width
+        self.depth = depth
+        self.rows = [array('L', [0]) * width for i in xrange(depth)]
+        self.total = 0
+
+    def _cells(self, key):
+        # one md5 gives four independent 32-bit hashes
+        digest = md5.new(key).hexdigest()
+        return [int(digest[8 * i:8 * i + 8], 16) % self.width for i in xrange(self.depth)]
+
+    def add(self, key, count=1):
+        "Count `key` and return its new estimate."
+        estimate = None
+        for row, cell in zip(self.rows, self._cells(key)):
+            row[cell] += count
+            if estimate is None or row[cell] < estimate:
+                estimate = row[cell]
+        self.total += count
+        return estimate
+
+    def __getitem__(self, key):
+        return min(row[cell] for row, cell in zip(self.rows, self._cells(key)))
+
+    def halve(self):
+        for row in self.rows:
+            for i in xrange(self.width):
+                row[i] >>= 1
+        self.total >>= 1
+
+
+class TopK(object):
+    "The `k` keys with the highest estimates in a CountMinSketch."
+    def __init__(self, sketch, k=TOPK):
+        self.sketch = sketch
+        self.k = k
+        self.counts = dict()
+        self.floor = 0
+
+    def add(self, key, count=1):
+        estimate = self.sketch.add(key, count)
+        if key in self.counts or len(self.counts) < self.k:
+            self.counts[key] = estimate
+        elif estimate > self.floor:
+            del self.counts[min(self.counts, key=self.counts.get)]
+            self.counts[key] = estimate
+        else:
+            return
+        if len(self.counts) == self.k:
+            self.floor = min(self.counts.itervalues())
+
+    def halve(self):
+        self.sketch.halve()
+        for key in self.counts.keys():
+            self.counts[key] >>= 1
+        self.floor >>= 1
+
+    def top(self, limit=None):
+        ranked = sorted(self.counts.iteritems(), key=lambda item: -item[1])
+        return ranked[:limit]
+
+
+class LoadTracker(object):
+    def __init__(self, k=TOPK, width=WIDTH, depth=DEPTH, halflife=HALFLIFE):
+        """Counts requests by key and by ring point. Every `halflife`
+        requests all counts are halved, so they follow the current load
+        rather than the whole history.
+        """
+        self.keys = TopK(CountMinSketch(width, depth), k)
+        self.points = defaultdict(int)
+        self.halflife = halflife
+        self.requests = 0
+
+    def record(self, key, point):
+        self.keys.add(key)
+        self.points[point] += 1
+        self.requests += 1
+        if self.requests % self.halflife == 0:
+            self.keys.halve()
+            for point in self.points.keys():
+                self.points[point] >>= 1
+                if not self.points[point]:
+                    del self.points[point]
+
+    def hot_keys(self, limit=None):
+        return self.keys.top(limit)
+
+    def hot_points(self, limit=None):
+        ranked = sorted(self.points.iteritems(), key=lambda item: -item[1])
+        return ranked[:limit]
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+snapshot.py
+
+A compact, checksummed file format for saving a node's items, so that an
+in-memory node can restart warm.
+
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import os
+import struct
+from zlib import crc32
+
+MAGIC = 'diststore snapshot 1\n'
+RECORD = struct.Struct('>iIId')
+END = 0xffffffff
+
+def write(path, items):
+    """Write (key, value, deadline) items to `path`. Each record carries
+    a checksum, and the file only takes the place of an older snapshot
+    once it is complete.
+    """
+    temp = path + '.tmp'
+    out = open(temp, 'wb')
+    try:
+        out.write(MAGIC)
+        count = 0
+        for key, value, deadline in items:
+            value = str(value)
+            out.write(RECORD.pack(crc32(value, crc32(key)), len(key), len(value), deadline))
+            out.write(key)
+            out.write(value)
+            count += 1
+        out.write(RECORD.pack(0, END, count, 0))
+        out.flush()
+        os.fsync(out.fileno())
+    finally:
+        out.close()
+    os.rename(temp, path)
+
+def read(path):
+    """Give back the (key, value, deadline) items in the snapshot at `path`,
+    one at a time. Raises ValueError on a damaged or truncated file."""
+    source = open(path, 'rb')
+    try:
+        if source.read(len(MAGIC)) != MAGIC:
+            raise ValueError('%s is not a snapshot' % path)
+        count = 0
+        while True:
+            header = source.read(RECORD.size)
+            if len(header) < RECORD.size:
+                raise ValueError('%s is truncated' % path)
+            crc, klen, vlen, deadline = RECORD.unpack(header)
+            if klen == END:
+                if vlen != count:
+                    raise ValueError('%s holds %d of %d items' % (path, count, vlen))
+                return
+            key = source.read(klen)
+            value = source.read(vlen)
+            if len(value) < vlen:
+                raise ValueError('%s is truncated' % path)
+            if crc32(value, crc32(key)) != crc:
+                raise ValueError('bad checksum for %r in %s' % (key, path))
+            count += 1
+            yield key, value, deadline
+    finally:
+        source.close()
@@ -0,0 +1,461 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+storage.py
+
+Storage engines for diststore nodes. Each one behaves enough like the
+defaultdict(str) that StoreHandler started with that it can be swapped in
+for `StoreHandler.store`.
+
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import os
+import mmap
+import struct
+from time import time
+from collections import defaultdict, OrderedDict
+from zlib import crc32
+
+SEGMENTSIZE = 64 * 1024 * 1024
+SEGMENTNAME = 'segment-%06d.dat'
+
+# record kind, crc32 of key and value, key length, value length
+HEADER = struct.Struct('>BIII')
+END, PUT, DELETE = 0, 1, 2
+
+class MmapStore(object):
+    """A dict-like store that keeps its values in memory-mapped segment files.
+
+    Records are appended to fixed-size, preallocated segments. Only the key
+    index lives on the Python heap: values are handed out as buffer slices
+    of the mapped segments, so reading never copies and the OS page cache
+    does all of the caching. Reopening a directory only walks the record
+    headers, so a restarted node is serving again almost immediately.
+    """
+    def __init__(self, path, segment_size=SEGMENTSIZE):
+        self.path = path
+        self.segment_size = segment_size
+        self.index = dict()
+        self.maps = dict()
+        self.live = 0
+        self.garbage = 0
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        numbers = sorted(int(name[8:14]) for name in os.listdir(path)
+                         if name.startswith('segment-'))
+        for number in numbers:
+            self._scan(number, verify=(number == numbers[-1]))
+        if numbers and numbers[-1] in self.maps:
+            self.active = numbers[-1]
+        else:
+            self._new_segment(numbers and numbers[-1] + 1 or 0, segment_size)
+
+    def _filename(self, number):
+        return os.path.join(self.path, SEGMENTNAME % number)
+
+    def _new_segment(self, number, size):
+        f = open(self._filename(number), 'w+b')
+        f.truncate(size)
+        self.maps[number] = mmap.mmap(f.fileno(), size)
+        f.close()
+        self.active = number
+        self.offset = 0
+
+    def _scan(self, number, verify=False):
+        """Rebuild the index from a segment's record headers.
+
+        Sealed segments are trusted; only the last one, which may hold a torn
+        write from a crash, has its checksums verified.
+        """
+        f = open(self._filename(number), 'r+b')
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            f.close()
+            os.remove(self._filename(number))
+            return
+        m = self.maps[number] = mmap.mmap(f.fileno(), size)
+        f.close()
+        pos = 0
+        while pos + HEADER.size <= size:
+            kind, crc, klen, vlen = HEADER.unpack_from(m, pos)
+            start = pos + HEADER.size
+            end = start + klen + vlen
+            if kind == END or end > size:
+                break
+            if verify and crc32(buffer(m, start, klen + vlen)) & 0xffffffff != crc:
+                print 'dropping torn record in %s' % self._filename(number)
+                break
+            key = m[start:start + klen]
+            self._forget(key)
+            if kind == PUT:
+                self.index[key] = (number, start + klen, vlen)
+                self.live += vlen
+            pos = end
+        self.offset = pos
+
+    def _forget(self, key):
+        if key in self.index:
+            length = self.index.pop(key)[2]
+            self.live -= length
+            self.garbage += length
+
+    def _append(self, kind, key, value):
+        length = HEADER.size + len(key) + len(value)
+        if self.offset + length > len(self.maps[self.active]):
+            self.maps[self.active].flush()
+            self._new_segment(self.active + 1, max(self.segment_size, length))
+        m = self.maps[self.active]
+        start = self.offset + HEADER.size
+        crc = crc32(value, crc32(key)) & 0xffffffff
+        m[self.offset:start] = HEADER.pack(kind, crc, len(key), len(value))
+        m[start:start + len(key)] = key
+        # write() takes a buffer as it is, where slice assignment wants a str
+        m.seek(start + len(key))
+        m.write(value)
+        self.offset += length
+        return start + len(key)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def get(self, key, default=None):
+        try:
+            number, offset, length = self.index[key]
+        except KeyError:
+            return default
+        return buffer(self.maps[number], offset, length)
+
+    def __getitem__(self, key):
+        "Like defaultdict(str), a missing key reads as '', but is not inserted."
+        return self.get(key, '')
+
+    def __setitem__(self, key, value):
+        self._forget(key)
+        offset = self._append(PUT, key, value)
+        self.index[key] = (self.active, offset, len(value))
+        self.live += len(value)
+        self._maybe_compact()
+
+    def __delitem__(self, key):
+        if key not in self.index:
+            raise KeyError(key)
+        self._forget(key)
+        self._append(DELETE, key, '')
+        self._maybe_compact()
+
+    def _maybe_compact(self):
+        "Reclaim space once dead records outweigh both a segment and the live data."
+        if self.garbage > self.segment_size and self.garbage > self.live:
+            self.compact()
+
+    def keys(self):
+        return self.index.keys()
+
+    def iteritems(self):
+        for key in self.index.keys():
+            yield key, self.get(key)
+
+    def items(self):
+        return list(self.iteritems())
+
+    def compact(self):
+        """Copy the live records into fresh segments and drop the old ones.
+
+        Buffers already handed out keep their old mappings alive, so this is
+        safe to call while values are still being sent.
+        """
+        old = sorted(self.maps)
+        live = sorted(self.index.items(), key=lambda item: item[1])
+        self.index = dict()
+        self.live = self.garbage = 0
+        self._new_segment(old[-1] + 1, self.segment_size)
+        for key, (number, offset, length) in live:
+            self[key] = buffer(self.maps[number], offset, length)
+        for number in old:
+            del self.maps[number]
+            os.remove(self._filename(number))
+
+    def flush(self):
+        for m in self.maps.values():
+            m.flush()
+
+    def close(self):
+        """Flush the segments, or, once every key has gone, remove them so
+        that a restart on this directory has nothing to pick up."""
+        if self.index:
+            self.flush()
+            return
+        for number in sorted(self.maps):
+            del self.maps[number]
+            os.remove(self._filename(number))
+
+    def stats(self):
+        return dict(bytes=self.live, garbage=self.garbage, segments=len(self.maps))
+
+    def __repr__(self):
+        return '<MmapStore %s: %d keys in %d segments, %d bytes garbage>' % (
+            self.path, len(self.index), len(self.maps), self.garbage)
+
+
+ENTRYOVERHEAD = 64
+
+class CacheStore(object):
+    """A dict-like store held to a byte budget, for running as a cache.
+
+    Each entry is charged for its key, its value and a fixed overhead.
+    Inserting past the budget evicts entries picked by the subclass's
+    policy; misses never allocate anything. Counters are kept for stats().
+    If set, `evicted(key)` is called for each key the cache lets go of.
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.evicted = None
+        self.data = dict()
+        self.size = 0
+        self.counts = dict(hits=0, misses=0, evictions=0, evicted_bytes=0, rejections=0)
+
+    def _charge(self, key, value):
+        return len(key) + len(value) + ENTRYOVERHEAD
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def get(self, key, default=None):
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.counts['misses'] += 1
+            return default
+        self.counts['hits'] += 1
+        self._touch(key)
+        return value
+
+    def __getitem__(self, key):
+        return self.get(key, '')
+
+    def __setitem__(self, key, value):
+        charge = self._charge(key, value)
+        if key in self.data:
+            self._discard(key)
+        if charge > self.capacity:
+            self.counts['rejections'] += 1
+            if self.evicted:
+                self.evicted(key)
+            return
+        while self.size + charge > self.capacity:
+            victim = self._victim()
+            self.counts['evictions'] += 1
+            self.counts['evicted_bytes'] += self._charge(victim, self.data[victim])
+            self._discard(victim)
+            if self.evicted:
+                self.evicted(victim)
+        self.data[key] = value
+        self.size += charge
+        self._insert(key)
+
+    def __delitem__(self, key):
+        if key not in self.data:
+            raise KeyError(key)
+        self._discard(key)
+
+    def _discard(self, key):
+        self.size -= self._charge(key, self.data.pop(key))
+        self._remove(key)
+
+    def keys(self):
+        return self.data.keys()
+
+    def iteritems(self):
+        return self.data.iteritems()
+
+    def items(self):
+        return self.data.items()
+
+    def clear(self):
+        for key in self.data.keys():
+            self._discard(key)
+
+    def stats(self):
+        counts = dict(self.counts)
+        counts.update(bytes=self.size, capacity=self.capacity)
+        return counts
+
+    def __repr__(self):
+        return '<%s: %d keys, %d of %d bytes, %d evictions>' % (
+            self.__class__.__name__, len(self.data), self.size,
+            self.capacity, self.counts['evictions'])
+
+
+class LRUCache(CacheStore):
+    "Evicts the least recently used entry."
+    def __init__(self, capacity):
+        CacheStore.__init__(self, capacity)
+        self.order = OrderedDict()
+
+    def _touch(self, key):
+        del self.order[key]
+        self.order[key] = None
+
+    def _insert(self, key):
+        self.order[key] = None
+
+    def _remove(self, key):
+        del self.order[key]
+
+    def _victim(self):
+        return next(iter(self.order))
+
+
+class NearCache(LRUCache):
+    """Copies of values owned by other nodes, each kept for at most `ttl`
+    seconds. Entries are (deadline, value) pairs, charged for the value."""
+    def __init__(self, capacity, ttl):
+        LRUCache.__init__(self, capacity)
+        self.ttl = ttl
+        self.counts['stale'] = 0
+
+    def _charge(self, key, entry):
+        return len(key) + len(entry[1]) + ENTRYOVERHEAD
+
+    def fresh(self, key, now=None):
+        "The cached value of `key`, or None if it is missing or too old."
+        entry = self.get(key)
+        if entry is None:
+            return None
+        if now is None:
+            now = time()
+        if entry[0] <= now:
+            self.counts['stale'] += 1
+            self._discard(key)
+            return None
+        return entry[1]
+
+    def add(self, key, value, now=None):
+        if now is None:
+            now = time()
+        self[key] = (now + self.ttl, value)
+
+    def discard(self, key):
+        if key in self.data:
+            self._discard(key)
+
+
+class LFUCache(CacheStore):
+    """Evicts the least frequently used entry, oldest first among equals.
+
+    Keys sit in one insertion-ordered bucket per use count, so touching and
+    evicting are both O(1).
+    """
+    def __init__(self, capacity):
+        CacheStore.__init__(self, capacity)
+        self.freq = dict()
+        self.buckets = defaultdict(OrderedDict)
+        self.least = 0
+
+    def _touch(self, key):
+        count = self.freq[key]
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+            if self.least == count:
+                self.least = count + 1
+        self.freq[key] = count + 1
+        self.buckets[count + 1][key] = None
+
+    def _insert(self, key):
+        self.freq[key] = 1
+        self.buckets[1][key] = None
+        self.least = 1
+
+    def _remove(self, key):
+        count = self.freq.pop(key)
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+
+    def _victim(self):
+        if self.least not in self.buckets:
+            self.least = min(self.buckets)
+        return next(iter(self.buckets[self.least]))
+
+
+class ClockCache(CacheStore):
+    """Approximates LRU with the CLOCK algorithm.
+
+    A hit only sets a reference bit, which is cheaper than reordering; the
+    hand sweeps the slots, clearing bits until it finds an unreferenced key.
+    """
+    def __init__(self, capacity):
+        CacheStore.__init__(self, capacity)
+        self.slots = []
+        self.position = dict()
+        self.referenced = dict()
+        self.hand = 0
+
+    def _touch(self, key):
+        self.referenced[key] = True
+
+    def _insert(self, key):
+        self.position[key] = len(self.slots)
+        self.slots.append(key)
+        self.referenced[key] = False
+
+    def _remove(self, key):
+        # fill the hole with the last slot to keep the clock dense
+        index = self.position.pop(key)
+        del self.referenced[key]
+        last = self.slots.pop()
+        if index < len(self.slots):
+            self.slots[index] = last
+            self.position[last] = index
+
+    def _victim(self):
+        while True:
+            if self.hand >= len(self.slots):
+                self.hand = 0
+            key = self.slots[self.hand]
+            if not self.referenced[key]:
+                return key
+            self.referenced[key] = False
+            self.hand += 1
+
+POLICIES = {
+    'lru': LRUCache,
+    'lfu': LFUCache,
+    'clock': ClockCache,
+}
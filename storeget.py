@@ -32,7 +32,7 @@ import sys
 sys.path.append('gen-py')
 
 from locator.ttypes import Location
-from storeserver import remote_call, parser, DEFAULTPORT, SERVICENAME
+from storeserver import remote_call, parser, DEFAULTPORT, SERVICENAME, CHUNKSIZE
 from location import find_matching_service, str2loc
 
 usage = '''
@@ -45,6 +45,27 @@ to the actual node that has it.'''
 
 parser.set_usage(usage)
 parser.remove_option('--port')
+parser.add_option("-f", "--file",
+                  help="Download the value into FILE, a chunk at a time",
+                  default=None)
+parser.add_option("--chunk-size", type="int",
+                  help="Bytes per chunk with --file [default=%d]" % CHUNKSIZE,
+                  default=CHUNKSIZE)
+
+def get_file(loc, key, path, chunk_size=CHUNKSIZE):
+    "Download the value of `key` into a file, without holding it all in memory."
+    offset = 0
+    out = open(path, 'wb')
+    try:
+        while True:
+            data = remote_call('get_chunk', loc, key, offset, chunk_size)
+            out.write(data)
+            offset += len(data)
+            if len(data) < chunk_size:
+                break
+    finally:
+        out.close()
+    return offset
 
 if __name__ == '__main__':
     (options, args) = parser.parse_args()
@@ -55,4 +76,7 @@ if __name__ == '__main__':
         loc = str2loc(options.peer)
     else:
         loc = find_matching_service(Location('localhost', DEFAULTPORT), SERVICENAME) or sys.exit()
-    print remote_call('get', loc, key)
+    if options.file:
+        get_file(loc, key, options.file, options.chunk_size)
+    else:
+        print remote_call('get', loc, key)
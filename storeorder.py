@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+storeorder.py
+
+Checks that the store reads back what was last written to it, with 
+several writers putting large values at once.
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import sys
+sys.path.append('gen-py')
+import threading
+
+from locator.ttypes import Location
+from storeserver import remote_call, parser, DEFAULTPORT, SERVICENAME
+from location import find_matching_service, str2loc
+
+usage = '''
+  python %prog [options]
+
+Looks for a storage node at PEER, either as specified, or 
+auto-discovered on the localhost starting from the default 
+port. Starts WRITERS threads, each sending its own keys to a 
+node of the network in turn. Each puts a key twice, then gets 
+it from the same node, and counts the reads that don't give 
+back the second value. Exits with 1 if there were any.'''
+
+parser.set_usage(usage)
+parser.remove_option('--port')
+parser.add_option("--writers", type="int",
+                  help="Writer threads to run at once [default=%default]",
+                  default=4)
+parser.add_option("--rounds", type="int",
+                  help="Put, put, get rounds for each writer [default=%default]",
+                  default=75)
+parser.add_option("--size", type="int",
+                  help="Bytes in each value [default=%default]",
+                  default=200000)
+
+def writer(number, nodes, rounds, size, stale):
+    for n in xrange(rounds):
+        loc = nodes[(number + n) % len(nodes)]
+        key = 'order-%d-%d' % (number, n % 8)
+        first = ('%d:%d:first:' % (number, n)).ljust(size, 'x')
+        second = ('%d:%d:second:' % (number, n)).ljust(size, 'y')
+        remote_call('put', loc, key, first)
+        remote_call('put', loc, key, second)
+        if remote_call('get', loc, key) != second:
+            stale.append((key, n))
+
+if __name__ == '__main__':
+    (options, args) = parser.parse_args()
+    if args:
+        parser.error("incorrect number of arguments")
+    if options.peer:
+        loc = str2loc(options.peer)
+    else:
+        loc = find_matching_service(Location('localhost', DEFAULTPORT), SERVICENAME) or sys.exit()
+    nodes = remote_call('get_all', loc)
+    stale = []
+    threads = [threading.Thread(target=writer, args=(number, nodes, options.rounds,
+                                                     options.size, stale))
+               for number in xrange(options.writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print '%d stale reads in %d' % (len(stale), options.writers * options.rounds)
+    for key, n in stale:
+        print '  %s in round %d' % (key, n)
+    sys.exit(stale and 1 or 0)
@@ -32,7 +32,7 @@ import sys
 sys.path.append('gen-py')
 
 from locator.ttypes import Location
-from storeserver import remote_call, parser, DEFAULTPORT, SERVICENAME
+from storeserver import remote_pipeline, parser, DEFAULTPORT, SERVICENAME
 from location import find_matching_service, str2loc
 
 usage = '''
@@ -80,5 +80,8 @@ if __name__ == '__main__':
         loc = str2loc(options.peer)
     else:
         loc = find_matching_service(Location('localhost', DEFAULTPORT), SERVICENAME) or sys.exit()
+    pipe = remote_pipeline(loc)
     for key, value in DICTIONARY.items():
-        remote_call('put', loc, key, value)
+        pipe.call('put', key, value)
+    pipe.wait()
+    pipe.close()
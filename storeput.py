@@ -30,13 +30,15 @@ THE SOFTWARE.
 
 import sys
 sys.path.append('gen-py')
+import md5
 
 from locator.ttypes import Location
-from storeserver import remote_call, parser, DEFAULTPORT, SERVICENAME
+from storeserver import remote_call, parser, DEFAULTPORT, SERVICENAME, CHUNKSIZE
 from location import find_matching_service, str2loc
 
 usage = '''
   python %prog [options] <key> <value>
+  python %prog [options] --file PATH <key>
 
 Looks for a storage node at PEER, either as specified, or 
 auto-discovered on the localhost starting from the default 
@@ -45,14 +47,49 @@ to the actual node that has it.'''
 
 parser.set_usage(usage)
 parser.remove_option('--port')
+parser.add_option("-t", "--ttl", type="int",
+                  help="Expire the item after TTL seconds",
+                  default=0)
+parser.add_option("-f", "--file",
+                  help="Upload the contents of FILE as the value, a chunk at a time",
+                  default=None)
+parser.add_option("--chunk-size", type="int",
+                  help="Bytes per chunk with --file [default=%d]" % CHUNKSIZE,
+                  default=CHUNKSIZE)
+
+def put_file(loc, key, path, ttl=0, chunk_size=CHUNKSIZE):
+    "Upload a file as the value of `key`, without reading it all into memory."
+    check = md5.new()
+    offset = 0
+    source = open(path, 'rb')
+    try:
+        while True:
+            data = source.read(chunk_size)
+            if not data and offset:
+                break
+            remote_call('put_chunk', loc, key, offset, data)
+            check.update(data)
+            offset += len(data)
+            if not data:
+                break
+    finally:
+        source.close()
+    return remote_call('put_commit', loc, key, offset, check.hexdigest(), ttl)
 
 if __name__ == '__main__':
     (options, args) = parser.parse_args()
-    if len(args) != 2:
+    if len(args) != (options.file and 1 or 2):
         parser.error("incorrect number of arguments")
-    (key, value) = args
     if options.peer:
         loc = str2loc(options.peer)
     else:
         loc = find_matching_service(Location('localhost', DEFAULTPORT), SERVICENAME) or sys.exit()
-    remote_call('put', loc, key, value)
+    if options.file:
+        if not put_file(loc, args[0], options.file, options.ttl, options.chunk_size):
+            sys.exit("upload of %s failed" % options.file)
+        sys.exit()
+    (key, value) = args
+    if options.ttl:
+        remote_call('put_ttl', loc, key, value, options.ttl)
+    else:
+        remote_call('put', loc, key, value)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+storescan.py
+
+Lists the items in a diststore network, in key order.
+
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import sys
+sys.path.append('gen-py')
+import heapq
+
+from locator.ttypes import Location
+from storeserver import remote_call, parser, DEFAULTPORT, SERVICENAME
+from location import find_matching_service, str2loc
+
+usage = '''
+  python %prog [options] [<prefix>]
+
+Looks for a storage node at PEER, either as specified, or 
+auto-discovered on the localhost starting from the default 
+port. Asks it for the nodes in the network, then pages through 
+the keys beginning with PREFIX on each of them, printing one 
+merged, sorted stream of tab-separated keys and values.'''
+
+parser.set_usage(usage)
+parser.remove_option('--port')
+parser.add_option("-l", "--limit", type="int",
+                  help="Fetch LIMIT items per call [default=100]",
+                  default=100)
+parser.add_option("-k", "--keys-only", action="store_true",
+                  help="Print only the keys",
+                  default=False)
+
+def node_items(loc, prefix, limit):
+    "The items on one node, a page at a time."
+    cursor = ''
+    while True:
+        page = remote_call('scan', loc, prefix, cursor, limit)
+        for item in page.items:
+            yield item.key, item.value
+        cursor = page.cursor
+        if not cursor:
+            break
+
+def scan(loc, prefix='', limit=100):
+    """All the items in the network, in key order. Only one page per node
+    is held at a time; a key seen on two nodes (mid-handoff) comes once."""
+    streams = [node_items(node, prefix, limit) for node in remote_call('get_all', loc)]
+    last = None
+    for key, value in heapq.merge(*streams):
+        if key != last:
+            yield key, value
+        last = key
+
+if __name__ == '__main__':
+    (options, args) = parser.parse_args()
+    if len(args) > 1:
+        parser.error("incorrect number of arguments")
+    prefix = args and args[0] or ''
+    if options.peer:
+        loc = str2loc(options.peer)
+    else:
+        loc = find_matching_service(Location('localhost', DEFAULTPORT), SERVICENAME) or sys.exit()
+    for key, value in scan(loc, prefix, options.limit):
+        if options.keys_only:
+            print key
+        else:
+            print '%s\t%s' % (key, value)
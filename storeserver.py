@@ -28,11 +28,22 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+import os
 import sys
 sys.path.append('gen-py')
-from collections import defaultdict
-from time import sleep
+import md5
+import math
+import mmap
+import signal
+import tempfile
+import heapq
+from time import time
+from select import select
+from bisect import bisect_left, bisect_right
 from functools import partial
+from itertools import islice
+from collections import defaultdict
+from optparse import make_option
 
 from thrift import Thrift
 from thrift.transport import TSocket
@@ -44,9 +55,21 @@ from locator.ttypes import Location
 from diststore import Store
 from diststore.ttypes import *
 import location
+import storage
+import compression
+import merkle
+import sketch
+import batching
+import snapshot
+import bloom
+import hedging
+from timer_wheel import TimerWheel
 
 DEFAULTPORT = 9900
-WAITPERIOD = 0.01
+SCANPAGE = 100
+CHUNKSIZE = 1 << 20
+UPLOADTIMEOUT = 300
+FILTERAGE = 30.0
 SERVICENAME = "diststore.Store"
 
 usage = '''
@@ -64,29 +87,514 @@ node hands off all its items to the appropriate neighbors.'''
 parser = location.parser
 parser.set_usage(usage)
 
+store_options = [
+    make_option("-d", "--data-dir",
+                  help="Keep values in memory-mapped segment files in DATA_DIR "
+                       "instead of on the heap",
+                  default=None),
+    make_option("-c", "--cache-size", type="int",
+                  help="Run as a cache, evicting items to stay under CACHE_SIZE bytes",
+                  default=0),
+    make_option("-e", "--eviction", type="choice", choices=sorted(storage.POLICIES),
+                  help="Cache eviction policy: lru, lfu or clock [default=lru]",
+                  default='lru'),
+    make_option("-z", "--compress", type="choice", choices=compression.CODECS,
+                  help="Compress values at rest and in transit with COMPRESS (%s)"
+                       % ' or '.join(compression.CODECS),
+                  default=None),
+    make_option("--compress-level", type="int",
+                  help="zlib compression level [default=6]",
+                  default=6),
+    make_option("--compress-threshold", type="int",
+                  help="Leave values shorter than COMPRESS_THRESHOLD bytes "
+                       "uncompressed [default=%d]" % compression.THRESHOLD,
+                  default=compression.THRESHOLD),
+    make_option("-n", "--near-cache", type="int",
+                  help="Keep up to NEAR_CACHE bytes of values owned by other nodes",
+                  default=0),
+    make_option("--near-ttl", type="float",
+                  help="Seconds a value stays in the near cache [default=5]",
+                  default=5.0),
+    make_option("-b", "--batch-size", type="int",
+                  help="Coalesce forwarded puts into batches of up to BATCH_SIZE per peer",
+                  default=0),
+    make_option("--batch-delay", type="float",
+                  help="Milliseconds a forwarded put may wait for its batch [default=2]",
+                  default=batching.DELAY * 1000),
+    make_option("-s", "--snapshot", dest="snapshot_path",
+                  help="Reload items from SNAPSHOT on startup, and save them "
+                       "there on SIGUSR1 or a snapshot() call",
+                  default=None),
+    make_option("--bloom", type="int", dest="bloom_capacity",
+                  help="Keep a Bloom filter sized for BLOOM_CAPACITY keys, and use "
+                       "peers' filters to answer for keys they don't hold",
+                  default=0),
+    make_option("-r", "--replicas", type="int",
+                  help="Keep copies of each item on the next REPLICAS - 1 nodes after "
+                       "its owner, to hedge reads with [default=1]",
+                  default=1),
+    make_option("--hedge-budget", type="int", metavar="PERCENT",
+                  help="Hedge reads to a replica when the owner is slow, adding at "
+                       "most PERCENT to the reads sent; 0 never hedges [default=%d]"
+                       % hedging.BUDGET,
+                  default=hedging.BUDGET),
+    make_option("--placement", type="choice", choices=['ring', 'zones'],
+                  help="Put replicas on the next nodes round the ring, or spread "
+                       "them over zones, then racks, and read from the nearest "
+                       "[default=ring]",
+                  default='ring'),
+]
+
+def capacity(data_dir=None, cache_size=0):
+    """Megabytes a node can keep: the size of the filesystem under its data
+    directory, its cache size, or else its memory."""
+    if data_dir:
+        if not os.path.isdir(data_dir):
+            os.makedirs(data_dir)
+        fs = os.statvfs(data_dir)
+        return fs.f_blocks * fs.f_frsize >> 20
+    if cache_size:
+        return max(1, cache_size >> 20)
+    return location.memory_size()
+
 remote_call = partial(location.generic_remote_call, Store.Client)
+remote_pipeline = partial(location.PipelinedClient, Store.Client)
 
 class StoreHandler(location.LocatorHandler, Store.Iface):
-    def __init__(self, peer=None, port=9900):
-        location.LocatorHandler.__init__(self, peer, port)
-        self.store = defaultdict(str)
+    def __init__(self, peer=None, port=9900, data_dir=None, cache_size=0, eviction='lru',
+                 compress=None, compress_level=6, compress_threshold=compression.THRESHOLD,
+                 near_cache=0, near_ttl=5.0, batch_size=0, batch_delay=batching.DELAY * 1000,
+                 snapshot_path=None, bloom_capacity=0, replicas=1, hedge_budget=hedging.BUDGET,
+                 placement='ring', zone=None, rack=None, weight=None, vnodes=location.VNODES,
+                 join_window=location.JOINWINDOW):
+        if weight == 'auto':
+            weight = capacity(data_dir, cache_size)
+        location.LocatorHandler.__init__(self, peer, port, zone, rack, weight, vnodes, join_window)
+        if data_dir:
+            self.store = storage.MmapStore(data_dir)
+        elif cache_size:
+            self.store = storage.POLICIES[eviction](cache_size)
+            self.store.evicted = self.evicted
+        else:
+            self.store = dict()
+        self.expiry = TimerWheel()
+        self.trees = dict()
+        self.trees_epoch = None
+        self.index = None
+        self.index_changes = dict()
+        self.uploads = dict()
+        self.chunk_source = None
+        if compress:
+            self.compressor = compression.Compressor(compress, compress_level, compress_threshold)
+        else:
+            self.compressor = None
+        if near_cache:
+            self.near = storage.NearCache(near_cache, near_ttl)
+        else:
+            self.near = None
+        self.near_epoch = None
+        # keys being fetched for the near cache: fetches under way, and invalidations since
+        self.fetching = dict()
+        self.flights = location.SingleFlight()
+        self.readers = dict()
+        self.load = sketch.LoadTracker()
+        if batch_size:
+            self.writes = batching.WriteBuffer(self.send_batch, batch_size, batch_delay / 1000.0)
+        else:
+            self.writes = None
+        self.snapshot_path = snapshot_path
+        self.snapshotting = None
+        self.bloom = None
+        self.bloom_capacity = bloom_capacity
+        self.subscribers = dict()
+        self.unsynced = set()
+        self.peer_filters = dict()
+        self.filter_ages = dict()
+        self.filters_epoch = None
+        self.negatives = 0
+        if bloom_capacity:
+            self.rebuild_filter()
+        self.replicas = replicas
+        self.placement = placement
+        self.copies = dict()
+        self.copies_expiry = TimerWheel()
+        self.copies_epoch = None
+        if replicas > 1 and hedge_budget:
+            self.hedger = hedging.Hedger(hedge_budget)
+        else:
+            self.hedger = None
     
     def get(self, key):
         """
         Parameters:
          - key
         """
+        self.expire()
+        self.record(key)
         dest = self.get_node(key)
         if location.loc2str(dest) == self.here:
-            if key in self.store:
-                print 'found %s' % key
-            return self.store[key]
+            stored = self.local_get(key)
+            if stored is None:
+                return ''
+            return self.unpack(stored)
+        else:
+            try:
+                return compression.decode(self.fetch(dest, key))
+            except location.NodeNotFound, tx:
+                self.remove(tx.location, map(location.str2loc, self.ring.nodes))
+                return ''
+            except location.TimedOut:
+                return ''
+    
+    def get_encoded(self, key, reader=None, budget=0):
+        """
+        Parameters:
+         - key
+         - reader: a node that will keep the value in its near cache
+         - budget: milliseconds the caller will still wait, or 0 for no limit
+        """
+        if not location.within(budget):
+            # nobody is waiting for the answer any more
+            return ''
+        self.expire()
+        self.record(key)
+        dest = self.get_node(key)
+        if location.loc2str(dest) == self.here:
+            stored = self.local_get(key)
+            if stored is None:
+                return ''
+            if reader is not None:
+                self.readers.setdefault(key, set()).add(location.loc2str(reader))
+            return stored
         else:
             try:
-                return remote_call('get', dest, key)
+                if reader is None:
+                    return self.fetch(dest, key)
+                self.settle(dest)
+                return remote_call('get_encoded', dest, key, reader, location.budget_left())
             except location.NodeNotFound, tx:
                 self.remove(tx.location, map(location.str2loc, self.ring.nodes))
                 return ''
+            except location.TimedOut:
+                return ''
+    
+    def fetch(self, dest, key):
+        """Get the encoded value of `key` from its owner `dest`, by way of
+        the near cache, if there is one. The owner is told who is caching
+        so that it can invalidate the copy when the key is next put.
+        Concurrent fetches of one key share a single call to the owner, made
+        without holding the node."""
+        self.settle(dest)
+        if self.bloom is not None:
+            known = self.peer_filter(dest)
+            if known is not None and key not in known:
+                self.negatives += 1
+                return ''
+        # worked out on the node: only the waiting on others is done without it
+        order = self.read_order(dest, key)
+        if self.near is None:
+            return self.flights.do(key, self.owner_get, dest, key, None, order)[0]
+        if self.near_epoch != self.ring.epoch:
+            # ownership may have moved, and the new owner knows no readers
+            self.near.clear()
+            self.near_epoch = self.ring.epoch
+        blob = self.near.fresh(key)
+        if blob is None:
+            seen = self.fetching.setdefault(key, [0, 0])
+            seen[0] += 1
+            invalidations = seen[1]
+            try:
+                blob, owned = self.flights.do(key, self.owner_get, dest, key, self.location, order)
+            finally:
+                seen[0] -= 1
+                if not seen[0]:
+                    del self.fetching[key]
+            # only the owner will tell us when a cached copy goes stale, and
+            # it may already have, for this very value, while the call was out
+            if blob and owned and seen[1] == invalidations:
+                self.near.add(key, blob)
+        return blob
+    
+    def read_order(self, dest, key):
+        """The nodes to ask for `key`, owned by `dest`: the owner and then
+        its replicas, or with zone placement, the nearest first. Gives back
+        None if only the owner is to be asked, and otherwise the nodes and
+        the copy this node keeps, if it is one of them."""
+        if self.replicas < 2 or (self.hedger is None and self.placement != 'zones'):
+            return None
+        owner = location.loc2str(dest)
+        nodes = [owner] + [node for node in self.replica_nodes(key) if node != owner]
+        if self.placement == 'zones':
+            nodes.sort(key=self.nearness)
+        local = None
+        if self.here in nodes:
+            local = self.get_replica(key)
+        return nodes, local
+    
+    def owner_get(self, dest, key, reader, order=None):
+        """Get the encoded value of `key` from its owner `dest`, or one of
+        the replicas in `order`, as worked out by `read_order`. Gives back
+        the value, and whether it came from the owner rather than a
+        replica. Touches nothing on the node, so it can run aside."""
+        if order is None:
+            return remote_call('get_encoded', dest, key, reader, location.budget_left()), True
+        return self.replicated_get(dest, key, reader, *order)
+    
+    def replicated_get(self, dest, key, reader, nodes, local):
+        """Ask the first of `nodes` for `key`: the owner `dest`, or with zone
+        placement, whichever of it and the replicas is nearest. If that
+        takes longer than usual, ask the next in line too: whichever answers
+        first wins, and the other connection is dropped. A replica without
+        the item doesn't count as an answer, and the next in line is asked
+        straight away. This node's own copy is `local`."""
+        owner = location.loc2str(dest)
+        nodes = list(nodes)
+        started = time()
+        hedge_after = None
+        if self.hedger is not None:
+            hedge_after = self.hedger.delay()
+        pending = dict()
+        failure = None
+        try:
+            while True:
+                if not pending:
+                    if not nodes:
+                        if failure is not None:
+                            raise failure
+                        return '', False
+                    answer = self.ask(pending, nodes.pop(0), owner, key, reader, local)
+                    if answer:
+                        return answer
+                    continue
+                hedge = hedge_after is not None and nodes
+                if hedge:
+                    timeout = max(0, started + hedge_after - time())
+                else:
+                    timeout = location.read_timeout()
+                ready = select(pending.keys(), [], [], timeout)[0]
+                if not ready:
+                    if not hedge:
+                        raise location.TimedOut(dest, 'get timed out')
+                    hedge_after = None
+                    self.hedger.hedged()
+                    answer = self.ask(pending, nodes.pop(0), owner, key, reader, local, True)
+                    if answer:
+                        self.hedger.won()
+                        return answer
+                    continue
+                for pipe in ready:
+                    seqid, owned, hedged, asked = pending.pop(pipe)
+                    try:
+                        outcome = pipe.wait()[seqid]
+                    finally:
+                        pipe.close()
+                    if self.hedger is not None and not hedged:
+                        self.hedger.record(time() - asked)
+                    if isinstance(outcome, Exception):
+                        failure = outcome
+                    elif owned or outcome:
+                        if hedged:
+                            self.hedger.won()
+                        return outcome, owned
+        finally:
+            for pipe, (seqid, owned, hedged, asked) in pending.items():
+                pipe.close()
+                if self.hedger is not None and not hedged:
+                    # the owner lost, or never answered: it took at least this
+                    # long, and leaving it out would make slow look rarer than it is
+                    self.hedger.record(time() - asked)
+    
+    def ask(self, pending, node, owner, key, reader, local, hedged=False):
+        """Send `node` a get for `key`, and add the connection to `pending`.
+        If `node` is this one, use its own copy, `local`, instead, and give
+        back (value, False) if it has one."""
+        if node == self.here:
+            if local:
+                return local, False
+            return None
+        owned = node == owner
+        try:
+            pipe = remote_pipeline(location.str2loc(node), 1)
+        except location.NodeNotFound:
+            if owned:
+                raise
+            return None
+        if owned:
+            seqid = pipe.call('get_encoded', key, reader, location.budget_left())
+        else:
+            seqid = pipe.call('get_replica', key)
+        pipe.flush()
+        pending[pipe] = (seqid, owned, hedged, time())
+    
+    def replica_nodes(self, key):
+        "The nodes after the owner of `key` that keep copies of it."
+        if self.replicas < 2 or not self.ring.nodes:
+            return []
+        if self.placement == 'zones':
+            return self.ring.spread_nodes(key, self.replicas, self.zone_of, self.rack_of)[1:]
+        return list(islice(self.ring.iterate_nodes(key), 1, self.replicas))
+    
+    def zone_of(self, node):
+        return self.locate(node).zone
+    
+    def rack_of(self, node):
+        place = self.locate(node)
+        return (place.zone, place.rack)
+    
+    def nearness(self, node):
+        "0 for a node in this one's rack, 1 for one elsewhere in its zone, 2 for any other."
+        place = self.locate(node)
+        if self.zone is None or place.zone != self.zone:
+            return 2
+        if self.rack is None or place.rack != self.rack:
+            return 1
+        return 0
+    
+    def send_copies(self, key, stored, ttl):
+        "Send a copy of an item this node owns to each of its replicas."
+        for dest in self.replica_nodes(key):
+            try:
+                remote_call('replicate', location.str2loc(dest), key, stored, ttl)
+            except (location.NodeNotFound, location.TimedOut):
+                pass
+    
+    def replica_copies(self):
+        """The copies this node keeps of items other nodes own, as encoded
+        blobs by key. They are thrown away whenever the ring changes, since
+        the owners and their replicas may have moved."""
+        if self.copies_epoch != self.ring.epoch:
+            self.copies = dict()
+            self.copies_expiry = TimerWheel()
+            self.copies_epoch = self.ring.epoch
+        for key in self.copies_expiry.advance():
+            self.copies.pop(key, None)
+        return self.copies
+    
+    def replicate(self, key, blob, ttl):
+        """
+        Parameters:
+         - key
+         - blob: the value as encoded by the compression module
+         - ttl
+        """
+        self.replica_copies()[key] = blob
+        if ttl > 0:
+            self.copies_expiry.schedule(key, time() + ttl)
+        else:
+            self.copies_expiry.cancel(key)
+    
+    def get_replica(self, key):
+        """
+        Parameters:
+         - key
+        """
+        return self.replica_copies().get(key, '')
+    
+    def invalidate(self, keys):
+        """
+        Parameters:
+         - keys
+        """
+        if self.near is not None:
+            for key in keys:
+                self.near.discard(key)
+                if key in self.fetching:
+                    self.fetching[key][1] += 1
+    
+    def bloom_filter(self, subscriber):
+        """
+        Parameters:
+         - subscriber: a node that keeps a copy, and is to hear of changes
+        """
+        if self.bloom is None:
+            return ''
+        name = location.loc2str(subscriber)
+        self.subscribers[name] = time()
+        self.unsynced.discard(name)
+        return self.bloom.dumps()
+    
+    def filter_update(self, owner, keys):
+        """
+        Parameters:
+         - owner
+         - keys: keys to add to the copy of the owner's filter, or none at
+           all if the copy is out of date
+        """
+        name = location.loc2str(owner)
+        known = self.peer_filters.get(name)
+        if known is None:
+            return
+        if keys:
+            for key in keys:
+                known.add(key)
+        else:
+            del self.peer_filters[name]
+    
+    def peer_filter(self, dest):
+        """This node's copy of the Bloom filter of `dest`, fetched on first
+        use, and again once it is FILTERAGE seconds old, in case an update
+        from `dest` went astray. None if `dest` keeps no filter."""
+        if self.filters_epoch != self.ring.epoch:
+            self.peer_filters = dict()
+            self.filters_epoch = self.ring.epoch
+        name = location.loc2str(dest)
+        if time() - self.filter_ages.get(name, 0) > FILTERAGE:
+            self.peer_filters.pop(name, None)
+        if name not in self.peer_filters:
+            try:
+                blob = remote_call('bloom_filter', dest, self.location)
+            except Thrift.TApplicationException:
+                blob = ''
+            except location.TimedOut:
+                # try again next time, rather than go without
+                return None
+            if blob:
+                self.peer_filters[name] = bloom.loads(blob)
+            else:
+                self.peer_filters[name] = None
+            self.filter_ages[name] = time()
+        return self.peer_filters[name]
+    
+    def rebuild_filter(self):
+        """Start a Bloom filter afresh, with room for twice the items held,
+        and tell the nodes with copies of the old one to drop them."""
+        self.bloom_capacity = max(self.bloom_capacity, 2 * len(self.store))
+        self.bloom = bloom.for_capacity(self.bloom_capacity)
+        for key in self.store.keys():
+            self.bloom.add(key)
+        self.publish_filter([])
+    
+    def publish_filter(self, keys):
+        """Pass changes to the Bloom filter on to the nodes holding copies.
+        No keys at all means their copies are out of date. A node that
+        missed an update is told its copy is out of date as soon as it can
+        be reached, and is only forgotten once it has been told, or its copy
+        has grown too old to be used."""
+        now = time()
+        for subscriber, fetched in self.subscribers.items():
+            if now - fetched > 2 * FILTERAGE:
+                # it will have fetched the filter afresh, if it is still there
+                del self.subscribers[subscriber]
+                self.unsynced.discard(subscriber)
+                continue
+            stale = not keys or subscriber in self.unsynced
+            try:
+                remote_call('filter_update', location.str2loc(subscriber), self.location,
+                            not stale and keys or [])
+            except (location.NodeNotFound, location.TimedOut):
+                self.unsynced.add(subscriber)
+                continue
+            if stale:
+                del self.subscribers[subscriber]
+                self.unsynced.discard(subscriber)
+    
+    def notify_readers(self, key):
+        "Tell the nodes holding `key` in their near caches to forget it."
+        for reader in self.readers.pop(key, ()):
+            try:
+                remote_call('invalidate', location.str2loc(reader), [key])
+            except location.NodeNotFound:
+                pass
         
     def put(self, key, value):
         """
@@ -94,96 +602,692 @@ class StoreHandler(location.LocatorHandler, Store.Iface):
          - key
          - value
         """
+        self.put_ttl(key, value, 0)
+    
+    def put_ttl(self, key, value, ttl):
+        """
+        Parameters:
+         - key
+         - value
+         - ttl: seconds to keep the item, or 0 to keep it indefinitely
+        """
+        self.expire()
+        self.record(key)
         dest = self.get_node(key)
         if location.loc2str(dest) == self.here:
-            print 'received %s' % key
-            self.store[key] = value
+            self.local_put(key, self.pack(value), ttl)
             return
         else:
             try:
-                remote_call('put', dest, key, value)
+                self.forward_put(dest, key, self.pack(value), ttl)
             except location.NodeNotFound, tx:
                 self.remove(tx.location, map(location.str2loc, self.ring.nodes))
                 return
     
-    def ping(self):
-        'Make it quiet for the example'
-        pass
+    def put_encoded(self, key, blob, ttl, budget=0):
+        """
+        Parameters:
+         - key
+         - blob: the value as encoded by the compression module
+         - ttl
+         - budget: milliseconds the caller gave the put, or 0 for no limit
+        """
+        if not location.within(budget):
+            print "dropped late put of %r" % key
+            return
+        self.expire()
+        self.record(key)
+        dest = self.get_node(key)
+        if location.loc2str(dest) == self.here:
+            self.local_put(key, blob, ttl)
+            return
+        else:
+            try:
+                self.forward_put(dest, key, blob, ttl)
+            except location.NodeNotFound, tx:
+                self.remove(tx.location, map(location.str2loc, self.ring.nodes))
+                return
     
-    def add(self, loc, authorities):
+    def put_batch(self, entries):
         """
         Parameters:
-         - location
-         - authorities
+         - entries
+        """
+        for entry in entries:
+            self.put_encoded(entry.key, entry.blob, entry.ttl)
+    
+    def put_chunk(self, key, offset, data):
+        """
+        Parameters:
+         - key
+         - offset: where `data` goes in the value; 0 starts a new upload
+         - data
+        """
+        self.expire()
+        dest = self.get_node(key)
+        if location.loc2str(dest) == self.here:
+            if offset == 0:
+                self.drop_stale_uploads()
+                # spooled behind the RAW tag, in the form it will be stored in
+                self.uploads[key] = (tempfile.TemporaryFile(), time())
+                self.uploads[key][0].write(compression.RAW)
+            elif key not in self.uploads:
+                return
+            upload = self.uploads[key][0]
+            upload.seek(offset + 1)
+            upload.write(data)
+        else:
+            try:
+                self.settle(dest)
+                remote_call('put_chunk', dest, key, offset, data)
+            except location.NodeNotFound, tx:
+                self.remove(tx.location, map(location.str2loc, self.ring.nodes))
+    
+    def put_commit(self, key, length, digest, ttl):
+        """
+        Parameters:
+         - key
+         - length: the length of the whole value
+         - digest: the md5 hex digest of the whole value
+         - ttl
+        Returns whether the value arrived whole and was stored.
+        """
+        self.expire()
+        self.record(key)
+        dest = self.get_node(key)
+        if location.loc2str(dest) == self.here:
+            if key not in self.uploads:
+                return False
+            upload = self.uploads.pop(key)[0]
+            try:
+                upload.flush()
+                if os.fstat(upload.fileno()).st_size != length + 1:
+                    return False
+                spooled = mmap.mmap(upload.fileno(), length + 1, access=mmap.ACCESS_READ)
+                value = buffer(spooled, 1)
+                check = md5.new()
+                for offset in xrange(0, length, CHUNKSIZE):
+                    check.update(buffer(value, offset, CHUNKSIZE))
+                if check.hexdigest() != digest:
+                    return False
+                stored = self.compressor and self.compressor.compress(value)
+                if not stored and isinstance(self.store, storage.MmapStore):
+                    # already tagged, so it goes from one mapping to the other
+                    stored = buffer(spooled)
+                elif not stored:
+                    # the one copy onto the heap, which the store keeps
+                    upload.seek(0)
+                    stored = upload.read()
+            finally:
+                upload.close()
+            self.local_put(key, stored, ttl)
+            return True
+        else:
+            try:
+                self.invalidate([key])
+                return remote_call('put_commit', dest, key, length, digest, ttl)
+            except location.NodeNotFound, tx:
+                self.remove(tx.location, map(location.str2loc, self.ring.nodes))
+                return False
+    
+    def drop_stale_uploads(self):
+        now = time()
+        for key, (upload, started) in self.uploads.items():
+            if now - started > UPLOADTIMEOUT:
+                upload.close()
+                del self.uploads[key]
+    
+    def get_chunk(self, key, offset, length):
+        """
+        Parameters:
+         - key
+         - offset
+         - length: the most bytes to return; fewer means the end of the value
         """
-        key = location.loc2str(loc)
-        authorities.append(self.location)
-        destinations = location.select_peers(self.ring.nodes.difference(map(location.loc2str,authorities)))
-        for destination in destinations:
+        self.expire()
+        dest = self.get_node(key)
+        if location.loc2str(dest) == self.here:
+            if self.chunk_source is None or self.chunk_source[0] != key:
+                stored = self.local_get(key)
+                if stored is None:
+                    return ''
+                # keep the decoded value for the chunks still to come: a
+                # buffer onto the store if raw, but a whole decompressed
+                # copy on the heap if not
+                self.chunk_source = (key, self.unpack(stored))
+            return buffer(self.chunk_source[1], offset, length)
+        else:
             try:
-                remote_call('add', location.str2loc(destination), loc, authorities)
-                break
+                self.settle(dest)
+                return remote_call('get_chunk', dest, key, offset, length)
             except location.NodeNotFound, tx:
                 self.remove(tx.location, map(location.str2loc, self.ring.nodes))
-        locstr = location.loc2str(loc)
-        self.ring.append(locstr)
-        sleep(WAITPERIOD)
+                return ''
+    
+    def forward_put(self, dest, key, blob, ttl):
+        "Pass a put on to the owner `dest`, by way of the write buffer, if there is one."
+        self.invalidate([key])
+        known = self.peer_filters.get(location.loc2str(dest))
+        if known is not None:
+            # so that reads through this node see the put straight away
+            known.add(key)
+        if self.writes is None:
+            try:
+                remote_call('put_encoded', dest, key, blob, ttl, location.budget_left())
+            except location.TimedOut:
+                print "dropped put of %r: %s timed out" % (key, location.loc2str(dest))
+        else:
+            self.reroute_writes()
+            self.writes.add(location.loc2str(dest), Entry(key, blob, ttl))
+    
+    def send_batch(self, dest, entries):
+        try:
+            remote_call('put_batch', location.str2loc(dest), entries)
+        except location.TimedOut:
+            # slow, not gone: once more, before any later batch for it
+            remote_call('put_batch', location.str2loc(dest), entries)
+    
+    def settle(self, dest):
+        "Make sure puts still buffered for `dest` get there before anything else."
+        if self.writes is not None:
+            self.writes.flush(location.loc2str(dest))
+            self.reroute_writes()
+    
+    def reroute_writes(self):
+        """Put the batches the write buffer failed to deliver back through
+        the ring, without the peer that failed if it has gone. A peer that
+        was only slow stays, and its batch is dropped, as an unbatched put
+        would be."""
+        for dest, entries, error in self.writes.take_failed():
+            if isinstance(error, location.TimedOut):
+                print "dropped %d puts: %s timed out" % (len(entries), dest)
+                continue
+            if isinstance(error, location.NodeNotFound) and dest in self.ring.nodes:
+                self.remove(location.str2loc(dest), map(location.str2loc, self.ring.nodes))
+            for entry in entries:
+                self.put_encoded(entry.key, entry.blob, entry.ttl)
+    
+    def pack(self, value):
+        """Turn a value into the form it is stored in, which is also the
+        encoded blob sent between nodes: tagged, and compressed if worth it.
+        So a stored value goes out to another node untouched."""
+        if self.compressor:
+            return self.compressor.encode(value)
+        return compression.encode_raw(value)
+    
+    def unpack(self, stored):
+        return compression.decode(stored)
+    
+    def local_get(self, key):
+        "The stored form of a live item, or None."
+        stored = self.store.get(key)
+        remaining = self.expiry.remaining(key)
+        if stored is None or (remaining is not None and remaining <= 0):
+            return None
+        print 'found %s' % key
+        return stored
+    
+    def local_put(self, key, stored, ttl=0):
+        print 'received %s' % key
+        self.store[key] = stored
+        if key not in self.store:
+            # too big for the cache, which has let any older value go
+            return
+        self.track(key, stored)
+        self.notify_readers(key)
+        if self.bloom is not None and self.bloom.add(key):
+            if self.bloom.count > self.bloom_capacity:
+                self.rebuild_filter()
+            else:
+                self.publish_filter([key])
+        if ttl > 0:
+            self.expiry.schedule(key, time() + ttl)
+        else:
+            self.expiry.cancel(key)
+        if self.replicas > 1:
+            self.send_copies(key, stored, ttl)
+    
+    def drop(self, key):
+        del self.store[key]
+        self.track(key)
+        self.readers.pop(key, None)
+        self.expiry.cancel(key)
+    
+    def let_go(self, key):
+        """Drop `key`, once handed over, unless it has gone meanwhile, or
+        the ring has changed to give it back to this node. True if dropped."""
+        if key not in self.store or location.loc2str(self.get_node(key)) == self.here:
+            return False
+        self.drop(key)
+        return True
+    
+    def evicted(self, key):
+        "Forget what else is kept about `key`, now that the cache has let it go."
+        self.track(key)
+        self.notify_readers(key)
+        self.expiry.cancel(key)
+    
+    def expire(self):
+        "Drop the items whose time-to-live has run out since the last call."
+        for key in self.expiry.advance():
+            if key in self.store:
+                del self.store[key]
+                self.track(key)
+                self.notify_readers(key)
+                print 'expired %s' % key
+    
+    def time_to_live(self, key, now=None):
+        """The whole seconds `key` has left to live, 0 if it never expires,
+        or None if it already has."""
+        remaining = self.expiry.remaining(key, now)
+        if remaining is None:
+            return 0
+        elif remaining > 0:
+            return int(math.ceil(remaining))
+        return None
+    
+    def live_items(self):
+        """The stored items that have not expired, each with the whole
+        seconds it has left to live, or 0 if it never expires."""
+        now = time()
         for key, value in self.store.items():
-            if location.loc2str(self.get_node(key)) == locstr:
-                remote_call('put', loc, key, value)
-                del self.store[key] 
-                print 'dropped %s' % key
-        print "added %s:%d" % (loc.address, loc.port)
+            ttl = self.time_to_live(key, now)
+            if ttl is not None:
+                yield key, value, ttl
+    
+    def hash_trees(self):
+        """This node's Merkle trees, by the ring point that ends their arc.
+        They are built on first use, kept up to date on every change to the
+        store, and thrown away whenever the ring changes."""
+        if self.trees_epoch != self.ring.epoch:
+            self.trees = defaultdict(merkle.MerkleTree)
+            self.trees_epoch = self.ring.epoch
+            for key, value, ttl in self.live_items():
+                self.trees[self.ring.get_point(key)].update(key, value)
+        return self.trees
+    
+    def track(self, key, stored=None):
+        "Keep the hash trees and key index, if built, in step with a change to `key`."
+        if self.chunk_source is not None and self.chunk_source[0] == key:
+            self.chunk_source = None
+        if self.trees_epoch == self.ring.epoch:
+            tree = self.trees[self.ring.get_point(key)]
+            if stored is None:
+                tree.discard(key)
+            else:
+                tree.update(key, stored)
+        if self.index is not None:
+            self.index_changes[key] = stored is not None
+            if len(self.index_changes) > len(self.index):
+                # cheaper to sort afresh, if it is ever needed again
+                self.index = None
+                self.index_changes = dict()
+    
+    def sorted_keys(self):
+        """The keys held, in order. Built on first use, then brought up to
+        date with the keys changed since, in one pass, when next needed."""
+        if self.index is None:
+            self.index = sorted(self.store.keys())
+            self.index_changes = dict()
+        elif self.index_changes:
+            changes, self.index_changes = self.index_changes, dict()
+            added = sorted(key for key, held in changes.iteritems() if held)
+            self.index = list(heapq.merge((key for key in self.index if key not in changes), added))
+        return self.index
+    
+    def scan(self, prefix, cursor, limit):
+        """
+        Parameters:
+         - prefix
+         - cursor: the cursor from the previous page, or '' to start
+         - limit: the most items to return
+        """
+        self.expire()
+        if limit <= 0:
+            limit = SCANPAGE
+        keys = self.sorted_keys()
+        pos = bisect_left(keys, prefix)
+        if cursor:
+            pos = max(pos, bisect_right(keys, cursor))
+        items = []
+        while pos < len(keys) and len(items) < limit and keys[pos].startswith(prefix):
+            key = keys[pos]
+            pos += 1
+            stored = self.store.get(key)
+            if stored is None or self.time_to_live(key) is None:
+                continue
+            items.append(KeyValue(key, self.unpack(stored)))
+        if pos < len(keys) and keys[pos].startswith(prefix):
+            return ScanPage(items, keys[pos - 1])
+        return ScanPage(items, '')
+    
+    def merkle_hashes(self, arc, nodes):
+        """
+        Parameters:
+         - arc: the ring point ending the arc
+         - nodes
+        """
+        tree = self.hash_trees()[arc]
+        return [tree.hash(node) for node in nodes]
+    
+    def merkle_items(self, arc, nodes):
+        """
+        Parameters:
+         - arc: the ring point ending the arc
+         - nodes
+        """
+        tree = self.hash_trees()[arc]
+        items = dict()
+        for node in nodes:
+            items.update(tree.items(node))
+        return items
+    
+    def reconcile(self, loc):
+        """Hand over the items on the arcs `loc` now owns, sending only
+        those it does not already hold, as found by comparing hash trees.
+        The calls to `loc` are made aside: it may be reconciling with this
+        node at the same time, and can't answer while it holds its own."""
+        trees = self.hash_trees()
+        for point in self.ring.points(location.loc2str(loc)):
+            tree = trees.get(point)
+            if not tree:
+                continue
+            keys = list(tree.keys())
+            try:
+                send = merkle.differing(tree,
+                                        partial(location.aside, remote_call,
+                                                'merkle_hashes', loc, point),
+                                        partial(location.aside, remote_call,
+                                                'merkle_items', loc, point))
+            except (Thrift.TApplicationException, location.TimedOut):
+                # a peer that can't compare trees, or not in time, gets everything
+                send = keys
+            except location.NodeNotFound:
+                return
+            items = []
+            for key in send:
+                value = self.store.get(key)
+                ttl = self.time_to_live(key)
+                if value is not None and ttl is not None:
+                    items.append((key, value, ttl))
+            try:
+                taken = set(self.hand_over(loc, items))
+            except (location.NodeNotFound, location.TimedOut):
+                # keep them all; whoever owns them next gets them then
+                print "%s didn't take its items; keeping them for now" % location.loc2str(loc)
+                return
+            # what it already held, and what it took; anything it refused stays
+            sent = set(key for key, value, ttl in items)
+            for key in keys:
+                if key in sent and key not in taken:
+                    continue
+                if self.let_go(key):
+                    print 'dropped %s' % key
+    
+    def record(self, key):
+        "Count a request for `key` towards the load report."
+        self.load.record(key, self.ring.get_point(key))
+    
+    def load_report(self, limit):
+        """
+        Parameters:
+         - limit: the most keys and arcs to list
+        """
+        return LoadReport(requests=self.load.requests,
+            keys=[Count(key, count) for key, count in self.load.hot_keys(limit or None)],
+            arcs=[Count('%08x' % point, count) for point, count in self.load.hot_points(limit or None)])
+    
+    def stats(self):
+        counts = dict(keys=len(self.store), coalesced_gets=self.flights.shared)
+        if hasattr(self.store, 'stats'):
+            counts.update(self.store.stats())
+        if self.near is not None:
+            for name, count in self.near.stats().iteritems():
+                counts['near_' + name] = count
+        if self.bloom is not None:
+            counts.update(bloom_bits=self.bloom.bits, bloom_keys=self.bloom.count,
+                          bloom_negatives=self.negatives)
+        if self.replicas > 1:
+            counts['replica_copies'] = len(self.replica_copies())
+        if self.hedger is not None:
+            counts.update(self.hedger.stats())
+        return counts
+    
+    def snapshot(self):
+        """
+        Save the items to the snapshot file from a forked child, so that
+        serving carries on meanwhile. Returns False if there is no snapshot
+        file, or the last snapshot is still being written.
+        """
+        if not self.snapshot_path or isinstance(self.store, storage.MmapStore):
+            return False
+        if not self.reap_snapshot():
+            return False
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                snapshot.write(self.snapshot_path, self.snapshot_items())
+                status = 0
+            except Exception, ex:
+                print 'snapshot failed: %s' % ex
+            finally:
+                os._exit(status)
+        self.snapshotting = pid
+        print 'snapshot to %s in process %d' % (self.snapshot_path, pid)
+        return True
+    
+    def reap_snapshot(self, wait=False):
+        """Collect the child writing a snapshot once it has finished (or,
+        with `wait`, when it does), and report it if it failed. Returns
+        False while one is still being written."""
+        pid = self.snapshotting
+        if not pid:
+            return True
+        try:
+            done, status = os.waitpid(pid, not wait and os.WNOHANG or 0)
+        except OSError:
+            # collected already, on another thread
+            done, status = pid, 0
+        if not done:
+            return False
+        self.snapshotting = None
+        if os.WIFSIGNALED(status):
+            print 'snapshot in process %d killed by signal %d' % (pid, os.WTERMSIG(status))
+        elif os.WEXITSTATUS(status):
+            print 'snapshot in process %d failed with status %d' % (pid, os.WEXITSTATUS(status))
+        return True
+    
+    def snapshot_items(self):
+        now = time()
+        for key, value, ttl in self.live_items():
+            remaining = self.expiry.remaining(key, now)
+            if remaining is None:
+                deadline = 0
+            else:
+                deadline = now + remaining
+            yield key, value, deadline
+    
+    def restore(self):
+        "Load the items in the snapshot file, if there is one, but for those that have expired."
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return
+        now = time()
+        count = 0
+        try:
+            for key, blob, deadline in snapshot.read(self.snapshot_path):
+                if deadline and deadline <= now:
+                    continue
+                self.store[key] = blob
+                if deadline:
+                    self.expiry.schedule(key, deadline)
+                count += 1
+        except ValueError, ex:
+            print 'stopped reading snapshot: %s' % ex
+        print 'restored %d items from %s' % (count, self.snapshot_path)
+        if self.bloom is not None:
+            self.rebuild_filter()
+    
+    def hand_over(self, dest, items):
+        """Put `items`, as (key, value, ttl), to `dest` over one pipelined
+        connection, and give back the keys it took. If the connection breaks
+        this raises NodeNotFound, or TimedOut, and the caller keeps them all.
+        
+        This is done aside, without holding the node: `dest` may be handing
+        items to this node at the same time, and neither would read the
+        other's puts while holding its own. So the items may have changed by
+        the time it returns; drop them with `let_go`."""
+        return location.aside(self._hand_over, dest, items)
+    
+    def _hand_over(self, dest, items):
+        pipe = remote_pipeline(dest)
+        keys = dict()
+        try:
+            for key, value, ttl in items:
+                keys[pipe.call('put_encoded', key, value, ttl, 0)] = key
+            outcomes = pipe.wait()
+        finally:
+            pipe.close()
+        return [keys[seqid] for seqid, outcome in outcomes.iteritems()
+                if not isinstance(outcome, Exception)]
+    
+    def rebalance(self):
+        "Hand each item this node doesn't own over to the node that does."
+        self.expire()
+        moving = defaultdict(list)
+        for key, value, ttl in self.live_items():
+            dest = location.loc2str(self.get_node(key))
+            if dest != self.here:
+                moving[dest].append((key, value, ttl))
+        for dest, items in moving.items():
+            try:
+                for key in self.hand_over(location.str2loc(dest), items):
+                    self.let_go(key)
+            except location.NodeNotFound, tx:
+                print "not found"
+            except location.TimedOut:
+                print "%s timed out; keeping its items for now" % dest
+    
+    def reweigh(self, loc, authorities, budget=0):
+        """
+        Parameters:
+         - location: the node, with its new weight
+         - authorities
+         - budget: milliseconds left to finish in, or 0 for no limit
+        """
+        epoch = self.ring.epoch
+        location.LocatorHandler.reweigh(self, loc, authorities, budget)
+        if self.ring.epoch != epoch:
+            # the handover takes as long as it takes; the change has been passed on
+            location.lift_deadline()
+            self.rebalance()
+    
+    def ping(self):
+        'Make it quiet for the example'
+        pass
+    
+    def settle_joins(self):
+        "Take the waiting nodes into the ring, then hand each the items it now owns."
+        joined = location.LocatorHandler.settle_joins(self)
+        self.expire()
+        for loc in joined:
+            # our own add, come back round: there is no one to hand items to
+            if location.loc2str(loc) != self.here:
+                self.reconcile(loc)
+        return joined
     
     def debug(self):
         a = "self.location: %r\n" % self.location
         a += "self.ring.nodes:\n%r\n" % self.ring.nodes
+        a += "peers:\n%s\n" % '\n'.join(location.peer_tracker.describe())
         a += "self.store:\n%r\n" % self.store
+        a += "expiring: %d\n" % len(self.expiry)
         print a
     
     def cleanup(self):
+        if self.writes is not None:
+            self.writes.flush_all()
+            self.reroute_writes()
         self.ring.remove(self.here)
         informed = set()
         if self.ring.nodes:
-            for key, value in ((a, b) for (a, b) in self.store.items() if b):
-                dest = self.get_node(key)
+            moving = defaultdict(list)
+            for key, value, ttl in ((a, b, c) for (a, b, c) in self.live_items() if b):
+                moving[location.loc2str(self.get_node(key))].append((key, value, ttl))
+            for dest, items in moving.items():
+                dest = location.str2loc(dest)
                 try:
-                    if location.loc2str(dest) not in informed:
-                        remote_call('remove', dest, self.location, [self.location])
+                    remote_call('remove', dest, self.location, [self.location], 0)
                     remote_call('ping', dest)
                     informed.add(location.loc2str(dest))
-                    remote_call('put', dest, key, value)
+                    for key in self.hand_over(dest, items):
+                        self.let_go(key)
                 except location.NodeNotFound, tx:
                     print "not found"
-                    pass
+                except location.TimedOut:
+                    print "%s timed out" % location.loc2str(dest)
             if not informed:
                 for dest in location.select_peers(self.ring.nodes):
                     try:
-                        remote_call('remove', location.str2loc(dest), self.location, [self.location])
+                        remote_call('remove', location.str2loc(dest), self.location, [self.location], 0)
                         informed.add(dest)
                         break
+                    except location.TimedOut:
+                        pass
                     except location.NodeNotFound, tx:
                         self.ring.remove(location.loc2str(tx.location))            
+        if isinstance(self.store, storage.MmapStore):
+            # items no one would take stay on disk for next time
+            self.store.close()
+        if self.snapshot_path:
+            # don't race a child still writing to the same file
+            self.reap_snapshot(wait=True)
+            if len(self.store):
+                # no one to hand these to, so keep them for next time
+                snapshot.write(self.snapshot_path, self.snapshot_items())
+            elif os.path.exists(self.snapshot_path):
+                # everything has been handed off; don't resurrect it
+                os.remove(self.snapshot_path)
         
 
 def main(inputargs):
+    services = inputargs.pop('services')
     handler = StoreHandler(**inputargs)
-    processor = Store.Processor(handler)
+    processor = location.host(handler, services)
     transport = TSocket.TServerSocket(handler.port)
-    tfactory = TTransport.TBufferedTransportFactory()
-    pfactory = TBinaryProtocol.TBinaryProtocolFactory()
-    server = TServer.TSimpleServer(processor, transport, tfactory, pfactory)
+    server = location.LaneServer(processor, transport, *location.server_factories(),
+                                 daemon=True)
     
+    handler.restore()
     handler.local_join()
-    print 'Starting the server at %s...' % (handler.here)
+    handler.rebalance()
+    signal.signal(signal.SIGUSR1,
+                  lambda signum, frame: processor.lanes.run(location.DATA, handler.snapshot))
+    if handler.writes is not None:
+        handler.writes.retry = partial(processor.lanes.run, location.DATA, handler.reroute_writes)
+    signal.siginterrupt(signal.SIGUSR1, False)
+    signal.signal(signal.SIGCHLD, lambda signum, frame: handler.reap_snapshot())
+    signal.siginterrupt(signal.SIGCHLD, False)
+    print 'Starting the server at %s (%s)...' % (handler.here, location.describe_codec())
     try:
-        server.serve()
+        location.serve(server)
     finally:
-        handler.cleanup()
+        processor.lanes.run(location.CONTROL, handler.cleanup)
     print 'done.'
 
 if __name__ == '__main__':
+    parser.add_options(store_options)
     (options, args) = parser.parse_args()
+    del options.transport, options.protocol
+    del options.connect_timeout, options.read_timeout, options.deadline, options.idle_timeout
+    if options.data_dir and options.cache_size:
+        parser.error("--data-dir and --cache-size are mutually exclusive")
+    if options.data_dir and options.snapshot_path:
+        parser.error("--snapshot is for in-memory nodes; --data-dir already persists")
+    if options.replicas < 1:
+        parser.error("--replicas counts the owner, so must be at least 1")
+    if options.vnodes < 1:
+        parser.error("--vnodes must be at least 1")
     if not options.port:
         loc = location.ping_until_not_found(Location('localhost', DEFAULTPORT), 25)
         options.port = loc.port
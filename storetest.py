@@ -32,7 +32,7 @@ import sys
 sys.path.append('gen-py')
 
 from locator.ttypes import Location
-from storeserver import remote_call, parser, DEFAULTPORT, SERVICENAME
+from storeserver import remote_call, remote_pipeline, parser, DEFAULTPORT, SERVICENAME
 from location import find_matching_service, str2loc
 
 usage = '''
@@ -53,8 +53,12 @@ if __name__ == '__main__':
         loc = str2loc(options.peer)
     else:
         loc = find_matching_service(Location('localhost', DEFAULTPORT), SERVICENAME) or sys.exit()
-    for key in KEYS:
-        value = remote_call('get', loc, key)
+    pipe = remote_pipeline(loc)
+    calls = [(key, pipe.call('get', key)) for key in KEYS]
+    values = pipe.wait()
+    pipe.close()
+    for key, seqid in calls:
+        value = values[seqid]
         if value:
             print value
         else:
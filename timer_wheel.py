@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+timer_wheel.py
+
+A hierarchical timing wheel for expiring keys without scanning them.
+
+Level 0 has one slot per tick; each slot of level n spans a whole
+revolution of level n-1. A key sits in the coarsest slot that still
+separates it from the present, and drops a level each time the wheel
+comes around to its slot, so scheduling, cancelling and expiring are all
+O(1) amortized.
+
+The MIT License
+
+Copyright (c) 2009 Adam T. Lindsay.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import math
+from time import time
+
+class TimerWheel(object):
+    def __init__(self, tick=1.0, slots=64, levels=4, now=None):
+        """`tick` is the resolution in seconds. With the defaults, the wheel
+        reaches 64**4 ticks (about six months) before keys have to be
+        re-filed from the top level.
+        """
+        self.tick = tick
+        self.slots = slots
+        self.wheels = [[set() for i in xrange(slots)] for j in xrange(levels)]
+        self.deadlines = dict()
+        self.where = dict()
+        if now is None:
+            now = time()
+        self.current = int(now / tick)
+
+    def __len__(self):
+        return len(self.deadlines)
+
+    def __contains__(self, key):
+        return key in self.deadlines
+
+    def schedule(self, key, deadline):
+        "Expire `key` at `deadline`, in seconds since the epoch."
+        self.cancel(key)
+        self.deadlines[key] = deadline
+        self._file(key, int(math.ceil(deadline / self.tick)))
+
+    def cancel(self, key):
+        if key in self.deadlines:
+            del self.deadlines[key]
+            level, slot = self.where.pop(key)
+            self.wheels[level][slot].discard(key)
+
+    def remaining(self, key, now=None):
+        """Seconds left before `key` expires, or None if it never does.
+        Between ticks this can be zero or less for keys not yet swept."""
+        if key not in self.deadlines:
+            return None
+        if now is None:
+            now = time()
+        return self.deadlines[key] - now
+
+    def _file(self, key, expiry, earliest=1):
+        # while cascading, the current tick's slot is still to be swept
+        expiry = max(expiry, self.current + earliest)
+        delta = expiry - self.current
+        level = 0
+        while delta >= self.slots ** (level + 1) and level < len(self.wheels) - 1:
+            level += 1
+        # beyond the top level's reach, park in its furthest slot and refile later
+        expiry = min(expiry, self.current + self.slots ** (level + 1) - 1)
+        slot = (expiry // self.slots ** level) % self.slots
+        self.wheels[level][slot].add(key)
+        self.where[key] = (level, slot)
+
+    def advance(self, now=None):
+        "Move the wheel up to `now` and return the keys that have expired."
+        if now is None:
+            now = time()
+        target = int(now / self.tick)
+        expired = []
+        if not self.deadlines:
+            self.current = max(self.current, target)
+            return expired
+        while self.current < target:
+            self.current += 1
+            for level in xrange(1, len(self.wheels)):
+                span = self.slots ** level
+                if self.current % span:
+                    break
+                self._refile(level, (self.current // span) % self.slots)
+            bucket = self.wheels[0][self.current % self.slots]
+            self.wheels[0][self.current % self.slots] = set()
+            for key in bucket:
+                del self.where[key]
+                if self.deadlines[key] <= self.current * self.tick:
+                    del self.deadlines[key]
+                    expired.append(key)
+                else:
+                    self._file(key, int(math.ceil(self.deadlines[key] / self.tick)))
+        return expired
+
+    def _refile(self, level, slot):
+        bucket = self.wheels[level][slot]
+        self.wheels[level][slot] = set()
+        for key in bucket:
+            self._file(key, int(math.ceil(self.deadlines[key] / self.tick)), 0)
+